@@ -5,12 +5,18 @@ setup(
     version="0.1.0",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"seed_mcp.publishing": ["templates/*.html", "templates/*.css", "static/js/*.js"]},
     install_requires=[
         "fastmcp>=2.0.0",
         "pydantic>=2.0.0",
         "fastapi>=0.100.0",
+        "starlette>=0.46.0",
+        "sse-starlette>=2.1.0",
         "uvicorn>=0.23.0",
-        "requests>=2.31.0"
+        "requests>=2.31.0",
+        "jinja2>=3.0.0",
+        "markdown-it-py>=3.0.0",
+        "msgspec>=0.18"
     ],
     entry_points={
         'console_scripts': [
@@ -28,7 +28,11 @@ class RedactionManager:
             redacted_file_path: Path to the redacted.json file
         """
         self.redacted_file_path = redacted_file_path
+        # Replaced, never mutated in place, so a scan's snapshot of it stays valid
         self.rules: Dict[str, str] = {}
+        # The rules dict a longest-first ordering was built from, rebuilt lazily once
+        # self.rules is replaced
+        self._sorted: Optional[Tuple[Dict[str, str], List[Tuple[str, str]]]] = None
         self.load_rules()
     
     def load_rules(self) -> bool:
@@ -86,7 +90,7 @@ class RedactionManager:
             logger.error("Cannot add empty redaction rule")
             return False
         
-        self.rules[sensitive_term] = replacement
+        self.rules = {**self.rules, sensitive_term: replacement}
         return self.save_rules()
     
     def remove_rule(self, sensitive_term: str) -> bool:
@@ -103,7 +107,9 @@ class RedactionManager:
             logger.warning(f"Term '{sensitive_term}' not found in redaction rules")
             return False
         
-        del self.rules[sensitive_term]
+        rules = dict(self.rules)
+        del rules[sensitive_term]
+        self.rules = rules
         return self.save_rules()
     
     def get_rules(self) -> Dict[str, str]:
@@ -117,7 +123,12 @@ class RedactionManager:
     
     def _get_sorted_rules(self) -> List[Tuple[str, str]]:
         """Get rules sorted by length (longest first) to handle overlapping terms."""
-        return sorted(self.rules.items(), key=lambda x: len(x[0]), reverse=True)
+        rules = self.rules
+        cached = self._sorted
+        if cached is None or cached[0] is not rules:
+            cached = (rules, sorted(rules.items(), key=lambda x: len(x[0]), reverse=True))
+            self._sorted = cached
+        return cached[1]
     
     def _apply_single_rule(self, content: str, sensitive_term: str, replacement: str) -> Tuple[str, int]:
         """Apply a single redaction rule to content."""
@@ -230,18 +241,6 @@ class RedactionManager:
         
         return results
     
-    def _find_term_occurrences(self, content: str, sensitive_term: str) -> List[int]:
-        """Find all positions of a term in content."""
-        positions = []
-        index = 0
-        while True:
-            index = content.find(sensitive_term, index)
-            if index == -1:
-                break
-            positions.append(index)
-            index += len(sensitive_term)
-        return positions
-    
     def _create_preview_context(self, content: str, term: str, replacement: str, 
                                position: int, context_chars: int) -> Dict[str, str]:
         """Create a preview context for a single redaction."""
@@ -268,17 +267,58 @@ class RedactionManager:
         Returns:
             List of dictionaries with redaction previews
         """
-        previews = []
+        # Rules may be added or removed on the event loop while this scans in a worker
+        # thread, so only this snapshot is used from here on
+        sorted_rules = self._get_sorted_rules()
         
-        for sensitive_term, replacement in self.rules.items():
-            positions = self._find_term_occurrences(content, sensitive_term)
-            for position in positions:
+        # Replay apply_redactions' longest-first, term-by-term replacement so the preview
+        # shows exactly the redactions that will happen. origin maps each character of
+        # the partly redacted text back to its index in content (-1 inside replacements)
+        previews = []
+        current = content
+        origin: Optional[List[int]] = None
+        for sensitive_term, replacement in sorted_rules:
+            if not sensitive_term:
+                continue
+            index = current.find(sensitive_term)
+            if index == -1:
+                continue
+            if origin is None:
+                origin = list(range(len(content)))
+            
+            pieces: List[str] = []
+            next_origin: List[int] = []
+            last = 0
+            while index != -1:
                 preview = self._create_preview_context(
-                    content, sensitive_term, replacement, position, context_chars
+                    current, sensitive_term, replacement, index, context_chars
                 )
+                preview["position"] = self._original_position(origin, index, len(sensitive_term))
                 previews.append(preview)
+                pieces += (current[last:index], replacement)
+                next_origin += origin[last:index]
+                next_origin += [-1] * len(replacement)
+                last = index + len(sensitive_term)
+                index = current.find(sensitive_term, last)
+            pieces.append(current[last:])
+            next_origin += origin[last:]
+            current = "".join(pieces)
+            origin = next_origin
         
+        previews.sort(key=lambda preview: preview["position"])
         return previews
+    
+    @staticmethod
+    def _original_position(origin: List[int], index: int, length: int) -> int:
+        """Map a match in partly redacted text back to a position in the original content."""
+        for position in origin[index:index + length]:
+            if position >= 0:
+                return position
+        # The match lies entirely inside earlier replacements: report where they were
+        for position in reversed(origin[:index]):
+            if position >= 0:
+                return position + 1
+        return 0
 
 
 def _setup_test_manager() -> RedactionManager:
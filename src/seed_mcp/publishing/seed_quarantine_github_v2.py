@@ -6,19 +6,34 @@ Corrected implementation using single authorized.json with status enum.
 import json
 import os
 import logging
-import traceback
 import subprocess
 import shutil
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import ijson
+except ImportError:  # optional: streaming status lookups fall back to a full load
+    ijson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Environment for git subprocesses: never prompt for credentials, skip locale setup
+_GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "LC_ALL": "C"}
+
+# Repo-local git config written at clone time: bot identity for commits and stored credentials
+_CLONE_CONFIG = (
+    "user.email=seed-bot@example.com",
+    "user.name=SEED Publishing Bot",
+    "credential.helper=store",
+)
+
 
 class ConceptStatus(Enum):
     """Status enum for concepts in authorized.json"""
@@ -54,25 +69,34 @@ class GitHubQuarantineManager:
         
         # Temporary directory for cloning Carton repo
         self.temp_repo_dir = Path('/tmp/carton_clone')
+        self.concepts_dir = self.temp_repo_dir / "concepts"
+        
+        # Approved entries keyed by authorized.json's (mtime_ns, size) when they were computed
+        self._approved_cache: Optional[tuple] = None
         
         if not self.github_pat or not self.carton_repo_url:
             logger.warning("GitHub PAT or Carton repo URL not configured - operations will fail")
     
-    def _run_git_command(self, cmd: list[str], cwd: str) -> Dict[str, str]:
-        """Run a git command synchronously."""
+    def _run_git_command(self, cmd: list[str], cwd: str, capture: bool = True) -> Dict[str, str]:
+        """Run a git command synchronously.
+
+        With capture=False stdout is discarded and only stderr is kept for error reporting.
+        """
         try:
             result = subprocess.run(
                 cmd,
                 cwd=cwd,
-                capture_output=True,
+                stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=True
+                check=True,
+                env=_GIT_ENV
             )
-            return {"output": result.stdout.strip()}
+            return {"output": result.stdout.strip() if capture else ""}
         except subprocess.CalledProcessError as e:
             logger.error(f"Git command failed: {' '.join(cmd)}")
             logger.error(f"Error: {e.stderr}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
             return {"error": e.stderr.strip()}
     
     def _cleanup_existing_repo(self) -> None:
@@ -88,73 +112,95 @@ class GitHubQuarantineManager:
         credentials_path.write_text(auth_url + "\n")
         logger.debug("Set up Git credentials")
     
-    def _clone_repo(self) -> Dict[str, str]:
-        """Clone the repository."""
+    def _clone_url(self) -> str:
+        """Carton repo URL in the form git clone records as the origin remote."""
         repo_url = self.carton_repo_url
         if not repo_url.endswith(".git"):
             repo_url += ".git"
+        return repo_url
+    
+    def _clone_repo(self) -> Dict[str, str]:
+        """Clone the repository on the configured branch, with repo-local git config applied."""
+        cmd = ["git", "clone", "--branch", self.carton_branch]
+        for setting in _CLONE_CONFIG:
+            cmd += ["--config", setting]
+        cmd += [self._clone_url(), str(self.temp_repo_dir)]
 
-        result = self._run_git_command(["git", "clone", repo_url, str(self.temp_repo_dir)], ".")
+        result = self._run_git_command(cmd, ".", capture=False)
         if "error" in result:
             return {"error": f"Git clone failed: {result['error']}"}
         
-        logger.info(f"Cloned Carton repo to {self.temp_repo_dir}")
+        logger.info(f"Cloned Carton repo ({self.carton_branch}) to {self.temp_repo_dir}")
         return {"output": "Clone successful"}
     
-    def _run_git_commands_sequence(self, commands: List[List[str]], error_prefix: str = "Git command failed") -> Dict[str, str]:
+    def _run_git_commands_sequence(self, commands: List[List[str]], error_prefix: str = "Git command failed",
+                                   capture: bool = True) -> Dict[str, str]:
         """Run a sequence of git commands, stopping on first error."""
         for cmd in commands:
-            result = self._run_git_command(cmd, str(self.temp_repo_dir))
+            result = self._run_git_command(cmd, str(self.temp_repo_dir), capture=capture)
             if "error" in result:
                 return {"error": f"{error_prefix}: {result['error']}"}
         return {"output": "All commands executed successfully"}
     
-    def _configure_git_identity(self) -> Dict[str, str]:
-        """Configure git user identity."""
+    def _refresh_repo(self) -> Dict[str, str]:
+        """Reset an existing clone to the remote branch tip, discarding any local changes."""
+        repo_dir = str(self.temp_repo_dir)
+        origin = self._run_git_command(["git", "remote", "get-url", "origin"], repo_dir)
+        if "error" in origin:
+            return origin
+        if origin["output"] != self._clone_url():
+            return {"error": f"Existing clone points at {origin['output']}"}
+        
+        # Resetting to the fetched tip only makes sense on the branch we push from
+        branch = self._run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], repo_dir)
+        if "error" in branch:
+            return branch
+        if branch["output"] != self.carton_branch:
+            return {"error": f"Existing clone is on branch {branch['output']}"}
+        
         commands = [
-            ["git", "config", "user.email", "seed-bot@example.com"],
-            ["git", "config", "user.name", "SEED Publishing Bot"],
-            ["git", "config", "credential.helper", "store"],
+            ["git", "fetch", "origin", self.carton_branch],
+            ["git", "reset", "--hard", "FETCH_HEAD"],
+            ["git", "clean", "-fdx"],
         ]
-        result = self._run_git_commands_sequence(commands, "Git config failed")
-        if "error" in result:
-            return result
-        return {"output": "Git identity configured"}
+        return self._run_git_commands_sequence(commands, "Git refresh failed", capture=False)
     
     def _setup_git_repo(self) -> Dict[str, str]:
-        """Clone fresh repo from GitHub."""
-        self._cleanup_existing_repo()
+        """Bring the local clone up to date with GitHub, cloning it on first use."""
         self._setup_git_credentials()
         
+        # Fetching into the kept clone only transfers new objects, instead of
+        # re-downloading the whole repo on every operation
+        if (self.temp_repo_dir / ".git").exists():
+            refresh_result = self._refresh_repo()
+            if "error" not in refresh_result:
+                return {"output": "Git repo setup successful"}
+            logger.warning(f"Could not refresh existing clone, re-cloning: {refresh_result['error']}")
+        
+        self._cleanup_existing_repo()
+        # A single clone checks out the branch and writes identity/credential config,
+        # replacing separate config, checkout and pull round trips
         clone_result = self._clone_repo()
         if "error" in clone_result:
             return clone_result
         
-        config_result = self._configure_git_identity()
-        if "error" in config_result:
-            return config_result
-        
-        # Ensure we're on main branch and pull latest
-        checkout_result = self._run_git_command(["git", "checkout", self.carton_branch], str(self.temp_repo_dir))
-        if "error" in checkout_result:
-            return {"error": f"Failed to checkout {self.carton_branch} branch: {checkout_result['error']}"}
-        
-        pull_result = self._run_git_command(["git", "pull", "origin", self.carton_branch], str(self.temp_repo_dir))
-        if "error" in pull_result:
-            # Pull failure is not fatal - we can continue with cloned content
-            logger.warning(f"Failed to pull latest changes: {pull_result['error']}")
-        
         return {"output": "Git repo setup successful"}
     
     def _commit_and_push(self, commit_msg: str) -> Dict[str, str]:
         """Commit and push changes to remote repository."""
+        # Nothing staged or modified (e.g. idempotent re-authorize) - skip commit and push
+        status = self._run_git_command(["git", "status", "--porcelain"], str(self.temp_repo_dir))
+        if "error" not in status and not status["output"]:
+            logger.info(f"No changes to commit for: {commit_msg}")
+            return {"output": "No changes to commit"}
+        
         commands = [
             ["git", "add", "."],
             ["git", "commit", "-m", commit_msg],
-            ["git", "push", "origin", self.carton_branch],
+            ["git", "push", "origin", f"HEAD:{self.carton_branch}"],
         ]
 
-        result = self._run_git_commands_sequence(commands, "Git command failed")
+        result = self._run_git_commands_sequence(commands, "Git command failed", capture=False)
         if "error" in result:
             return result
         
@@ -163,7 +209,7 @@ class GitHubQuarantineManager:
     
     def _scan_all_concepts(self) -> List[str]:
         """Scan repo for ALL existing concepts."""
-        concepts_dir = self.temp_repo_dir / "concepts"
+        concepts_dir = self.concepts_dir
         if not concepts_dir.exists():
             logger.warning("No concepts directory found in repo")
             return []
@@ -189,7 +235,7 @@ class GitHubQuarantineManager:
                     return data
             except Exception as e:
                 logger.error(f"Failed to load authorized.json: {e}")
-                logger.debug(traceback.format_exc())
+                logger.debug("Traceback", exc_info=True)
                 return {}
         return {}
     
@@ -204,7 +250,7 @@ class GitHubQuarantineManager:
             return True
         except Exception as e:
             logger.error(f"Failed to save authorized.json: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
             return False
     
     def _add_missing_concepts(self, all_concepts: List[str], authorized_data: Dict[str, Dict[str, Any]]) -> int:
@@ -252,23 +298,13 @@ class GitHubQuarantineManager:
             "concept_type": "existing_concept"
         }
     
-    def _filter_quarantined_entries(self, authorized_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter entries for QUARANTINED status only."""
-        quarantined_entries = []
-        for concept_name, entry_data in authorized_data.items():
-            if entry_data.get("status") == ConceptStatus.QUARANTINED.value:
-                display_entry = self._format_entry_for_display(concept_name, entry_data)
-                quarantined_entries.append(display_entry)
-        return quarantined_entries
-    
-    def _filter_authorized_entries(self, authorized_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter entries for AUTHORIZED status only."""
-        authorized_entries = []
-        for concept_name, entry_data in authorized_data.items():
-            if entry_data.get("status") == ConceptStatus.AUTHORIZED.value:
-                display_entry = self._format_entry_for_display(concept_name, entry_data)
-                authorized_entries.append(display_entry)
-        return authorized_entries
+    def _filter_by_status(self, authorized_data: Dict[str, Dict[str, Any]], status: ConceptStatus) -> List[Dict[str, Any]]:
+        """Filter entries by status, formatting each match for display in the same pass."""
+        return [
+            self._format_entry_for_display(concept_name, entry_data)
+            for concept_name, entry_data in authorized_data.items()
+            if entry_data.get("status") == status.value
+        ]
     
     def publishing_review_quarantine(self) -> List[Dict[str, Any]]:
         """Get ALL concepts with QUARANTINED status for review (pulls fresh data from GitHub)."""
@@ -278,7 +314,7 @@ class GitHubQuarantineManager:
             return []
         
         authorized_data = self._load_authorized_json()
-        quarantined_entries = self._filter_quarantined_entries(authorized_data)
+        quarantined_entries = self._filter_by_status(authorized_data, ConceptStatus.QUARANTINED)
         
         logger.info(f"Found {len(quarantined_entries)} concepts with QUARANTINED status")
         return quarantined_entries
@@ -290,11 +326,26 @@ class GitHubQuarantineManager:
             logger.error(f"Failed to setup repo: {setup_result['error']}")
             return []
         
+        # authorized.json is only rewritten when a fetch or a status change alters it,
+        # so an unchanged stat means the previously filtered list is still current
+        signature = self._authorized_file_signature()
+        if signature is not None and self._approved_cache and self._approved_cache[0] == signature:
+            return list(self._approved_cache[1])
+        
         authorized_data = self._load_authorized_json()
-        approved_entries = self._filter_authorized_entries(authorized_data)
+        approved_entries = self._filter_by_status(authorized_data, ConceptStatus.AUTHORIZED)
+        self._approved_cache = (signature, approved_entries)
         
         logger.info(f"Found {len(approved_entries)} concepts with AUTHORIZED status")
-        return approved_entries
+        return list(approved_entries)
+    
+    def _authorized_file_signature(self) -> Optional[tuple]:
+        """Modification time and size of authorized.json, or None if it does not exist."""
+        try:
+            stat = (self.temp_repo_dir / "authorized.json").stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
     
     def _update_concept_status(self, concept_name: str, status: ConceptStatus, reviewer: str = None, reason: str = None) -> bool:
         """Update concept status in authorized.json."""
@@ -388,8 +439,8 @@ class GitHubQuarantineManager:
     def _find_concept_file(self, concept_name: str) -> Optional[Path]:
         """Find concept file in various possible locations."""
         concept_paths = [
-            self.temp_repo_dir / "concepts" / concept_name / f"{concept_name}_itself.md",
-            self.temp_repo_dir / "concepts" / concept_name / f"{concept_name}.md",
+            self.concepts_dir / concept_name / f"{concept_name}_itself.md",
+            self.concepts_dir / concept_name / f"{concept_name}.md",
             self.temp_repo_dir / concept_name / f"{concept_name}_itself.md",
             self.temp_repo_dir / concept_name / f"{concept_name}.md",
         ]
@@ -414,12 +465,37 @@ class GitHubQuarantineManager:
                 return {"content": content, "path": str(concept_path)}
             except Exception as e:
                 logger.error(f"Failed to read concept file {concept_path}: {e}")
-                logger.debug(traceback.format_exc())
+                logger.debug("Traceback", exc_info=True)
                 return {"error": f"Failed to read concept file: {e}"}
         
         logger.warning(f"Concept file not found for {concept_name}")
         return {"error": f"Concept file not found for {concept_name}"}
     
+    def iter_concept_content(self, concept_name: str, chunk_size: int = 16384) -> Optional[Iterator[str]]:
+        """Return an iterator over a concept file's content in chunks, or None if it is unavailable."""
+        if not self.temp_repo_dir.exists():
+            setup_result = self._setup_git_repo()
+            if "error" in setup_result:
+                logger.error(f"Failed to setup repo: {setup_result['error']}")
+                return None
+        
+        concept_path = self._find_concept_file(concept_name)
+        if concept_path is None:
+            logger.warning(f"Concept file not found for {concept_name}")
+            return None
+        
+        return self._iter_file_chunks(concept_path, chunk_size)
+    
+    @staticmethod
+    def _iter_file_chunks(path: Path, chunk_size: int) -> Iterator[str]:
+        """Yield a text file's content chunk by chunk."""
+        with open(path, 'r', encoding='utf-8') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    
     def get_authorization_status(self, concept_name: str) -> Optional[str]:
         """Get current status of a concept."""
         setup_result = self._setup_git_repo()
@@ -427,6 +503,34 @@ class GitHubQuarantineManager:
             logger.error(f"Failed to setup repo: {setup_result['error']}")
             return None
         
+        return self._get_status_streaming(concept_name)
+    
+    def get_authorization_statuses(self, concept_names: List[str]) -> Dict[str, Optional[str]]:
+        """Get current status of several concepts from one clone and one authorized.json parse."""
+        setup_result = self._setup_git_repo()
+        if "error" in setup_result:
+            logger.error(f"Failed to setup repo: {setup_result['error']}")
+            return {name: None for name in concept_names}
+        
+        authorized_data = self._load_authorized_json()
+        return {name: authorized_data.get(name, {}).get("status") for name in concept_names}
+    
+    def _get_status_streaming(self, concept_name: str) -> Optional[str]:
+        """Look up a single concept's status, stopping as soon as its entry is parsed."""
+        authorized_file = self.temp_repo_dir / "authorized.json"
+        if ijson is not None and authorized_file.exists():
+            try:
+                with open(authorized_file, 'rb') as f:
+                    # Legacy list-format files have no top-level keys to stream
+                    if not f.read(64).lstrip().startswith(b"["):
+                        f.seek(0)
+                        for key, entry in ijson.kvitems(f, ""):
+                            if key == concept_name:
+                                return entry.get("status")
+                        return None
+            except Exception as e:
+                logger.warning(f"Streaming lookup of authorized.json failed, falling back to full load: {e}")
+        
         authorized_data = self._load_authorized_json()
         if concept_name in authorized_data:
             return authorized_data[concept_name].get("status")
@@ -469,56 +573,67 @@ class GitHubQuarantineManager:
         return True
 
 
-# Convenience functions maintaining same interface
+# Convenience functions maintaining same interface.
+# They share one lazily created manager so repeated calls in the same process
+# reuse its state; multi-tenant callers should instantiate GitHubQuarantineManager explicitly.
+_default_manager: Optional[GitHubQuarantineManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def _get_default_manager() -> GitHubQuarantineManager:
+    """Return the shared manager used by the convenience functions, creating it on first use."""
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = GitHubQuarantineManager()
+        return _default_manager
+
+
 def publishing_review_quarantine() -> List[Dict[str, Any]]:
     """List all concepts with QUARANTINED status."""
-    manager = GitHubQuarantineManager()
-    return manager.publishing_review_quarantine()
+    return _get_default_manager().publishing_review_quarantine()
 
 
 def publishing_authorize_for_publishing(concept_name: str, reviewer: str = "isaac") -> bool:
     """Approve a concept for public publishing."""
-    manager = GitHubQuarantineManager()
-    return manager.publishing_authorize_for_publishing(concept_name, reviewer)
+    return _get_default_manager().publishing_authorize_for_publishing(concept_name, reviewer)
 
 
 def publishing_reject_concept(concept_name: str, reason: str = "Not suitable for publication") -> bool:
     """Reject a concept from being published."""
-    manager = GitHubQuarantineManager()
-    return manager.publishing_reject_concept(concept_name, reason)
+    return _get_default_manager().publishing_reject_concept(concept_name, reason)
 
 
 def get_authorization_status(concept_name: str) -> Optional[str]:
     """Check concept status."""
-    manager = GitHubQuarantineManager()
-    return manager.get_authorization_status(concept_name)
+    return _get_default_manager().get_authorization_status(concept_name)
+
+
+def get_authorization_statuses(concept_names: List[str]) -> Dict[str, Optional[str]]:
+    """Check the status of several concepts at once."""
+    return _get_default_manager().get_authorization_statuses(concept_names)
 
 
 def refresh_from_github() -> bool:
     """Pull fresh data from GitHub and ensure all concepts tracked."""
-    manager = GitHubQuarantineManager()
-    return manager.refresh_from_github()
+    return _get_default_manager().refresh_from_github()
 
 
 def sync_authorization_file() -> bool:
     """Push current authorized.json back to GitHub."""
-    manager = GitHubQuarantineManager()
-    return manager.sync_authorization_file()
+    return _get_default_manager().sync_authorization_file()
 
 
 def get_concept_content(concept_name: str) -> Dict[str, Any]:
     """Get concept content from GitHub repo."""
-    manager = GitHubQuarantineManager()
-    return manager.get_concept_content(concept_name)
+    return _get_default_manager().get_concept_content(concept_name)
 
 
 def publishing_needs_revision_concept(concept_name: str, reason: str = "Requires content revision") -> bool:
     """Mark a concept as needs revision."""
-    manager = GitHubQuarantineManager()
-    return manager.publishing_needs_revision_concept(concept_name, reason)
+    return _get_default_manager().publishing_needs_revision_concept(concept_name, reason)
 
 
 def publishing_needs_redact_concept(concept_name: str, reason: str = "Requires redaction") -> bool:
     """Mark a concept as needs redaction."""
-    manager = GitHubQuarantineManager()
-    return manager.publishing_needs_redact_concept(concept_name, reason)
\ No newline at end of file
+    return _get_default_manager().publishing_needs_redact_concept(concept_name, reason)
\ No newline at end of file
@@ -0,0 +1,756 @@
+let currentConcept = null;
+// Concept whose .concept-item row carries the 'selected' class
+let highlightedConcept = null;
+let quarantineEntries = [];
+// Concept content fetched ahead of time, keyed by concept name
+const conceptContentCache = new Map();
+const PREFETCH_COUNT = 10;
+// Content requests still in flight, keyed by concept name
+const pendingConceptFetches = new Map();
+// Last rendered HTML and ETag per concept, kept across list refreshes (oldest evicted first)
+// so a revisited concept is revalidated with If-None-Match instead of re-downloaded
+const conceptEtagCache = new Map();
+const ETAG_CACHE_MAX = 50;
+// Rendered .concept-item elements keyed by concept name, reused across refreshes
+const conceptItemIndex = new Map();
+// Row markup last written into each .concept-item, so unchanged rows are skipped
+const renderedRowMarkup = new WeakMap();
+
+// Page elements by role, filled in by cacheDomElements() on load
+const dom = {};
+// Rendered .rule-item rows keyed by redaction term, so add/remove touch a single row
+const ruleRowIndex = new Map();
+
+// Load quarantine entries on page load
+document.addEventListener('DOMContentLoaded', function() {
+    cacheDomElements();
+    dom.conceptContent.addEventListener('click', handleConceptLinkClick);
+    dom.rulesList.addEventListener('click', handleRuleListClick);
+    refreshQuarantine();
+    subscribeToQuarantineUpdates();
+});
+
+// Elements the handlers touch on every render, looked up once instead of per call
+function cacheDomElements() {
+    dom.quarantineList = document.getElementById('quarantine-list');
+    dom.conceptPreview = document.querySelector('.concept-preview');
+    dom.conceptContent = document.getElementById('concept-content');
+    dom.conceptActions = document.getElementById('concept-actions');
+    dom.status = document.getElementById('status');
+    dom.actionStatus = document.getElementById('action-status');
+    dom.rulesList = document.getElementById('rules-list');
+}
+
+// Refresh only when the server reports a change; EventSource reconnects on its own
+function subscribeToQuarantineUpdates() {
+    if (!window.EventSource) return;
+    const events = new EventSource('/api/quarantine/stream');
+    events.addEventListener('quarantine', () => refreshQuarantine());
+}
+
+async function refreshQuarantine() {
+    try {
+        showStatus('Pulling fresh data from GitHub...', 'info');
+        const response = await fetch('/api/quarantine');
+        const entries = await response.json();
+
+        quarantineEntries = entries;
+        conceptContentCache.clear();
+        renderQuarantineList(entries);
+        prefetchConceptContent(entries);
+        showStatus(`Pulled fresh data: ${entries.length} quarantine entries`, 'success');
+    } catch (error) {
+        showError('Failed to pull fresh data: ' + error.message);
+    }
+}
+
+async function prefetchConceptContent(entries) {
+    const names = entries
+        .slice(0, PREFETCH_COUNT)
+        .map(entry => entry.concept_name)
+        .filter(name => !conceptContentCache.has(name));
+    if (names.length === 0) return;
+
+    try {
+        const response = await fetch('/api/concepts/batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ names: names })
+        });
+        const results = await response.json();
+        for (const [name, result] of Object.entries(results)) {
+            if (result.html) {
+                conceptContentCache.set(name, result);
+            }
+        }
+    } catch (error) {
+        console.warn('Concept prefetch failed:', error);
+    }
+}
+
+// onChunk, if given, receives the rendered HTML piece by piece as it downloads
+function fetchConceptContent(conceptName, onChunk = null) {
+    if (conceptContentCache.has(conceptName)) {
+        return Promise.resolve(conceptContentCache.get(conceptName));
+    }
+    // Repeated clicks on the same concept share the request already in flight
+    if (pendingConceptFetches.has(conceptName)) {
+        return pendingConceptFetches.get(conceptName);
+    }
+
+    const request = readConceptHtml(conceptName, onChunk)
+        .then(result => {
+            if (result.html) {
+                conceptContentCache.set(conceptName, result);
+            }
+            return result;
+        })
+        .finally(() => pendingConceptFetches.delete(conceptName));
+    pendingConceptFetches.set(conceptName, request);
+    return request;
+}
+
+function rememberConceptEtag(conceptName, entry) {
+    conceptEtagCache.delete(conceptName);
+    conceptEtagCache.set(conceptName, entry);
+    if (conceptEtagCache.size > ETAG_CACHE_MAX) {
+        conceptEtagCache.delete(conceptEtagCache.keys().next().value);
+    }
+}
+
+async function readConceptHtml(conceptName, onChunk) {
+    const known = conceptEtagCache.get(conceptName);
+    const response = await fetch(`/api/concept/${encodeURIComponent(conceptName)}/content.html`,
+        known ? { headers: { 'If-None-Match': known.etag } } : {});
+    if (response.status === 304 && known) {
+        rememberConceptEtag(conceptName, known);
+        return { html: known.html };
+    }
+    if (!response.ok) {
+        const body = await response.json().catch(() => ({}));
+        return { error: body.detail || `HTTP ${response.status}` };
+    }
+
+    let html = '';
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    for (let chunk = await reader.read(); !chunk.done; chunk = await reader.read()) {
+        html += chunk.value;
+        if (onChunk) onChunk(chunk.value);
+    }
+    const etag = response.headers.get('ETag');
+    if (etag) {
+        rememberConceptEtag(conceptName, { etag: etag, html: html });
+    }
+    return { html: html };
+}
+
+// Show a concept while its HTML is still downloading. The parser of a detached document
+// keeps appending into its open container even after that node is moved into the page.
+function progressiveConceptRenderer(conceptName, contentEl) {
+    let doc = null;
+    return chunk => {
+        if (currentConcept !== conceptName) return;
+        if (!doc) {
+            renderConceptContent(conceptName, '', contentEl);
+            doc = document.implementation.createHTMLDocument('');
+            doc.write('<div>');
+            contentEl.querySelector('.markdown-content').append(doc.body.firstChild);
+        }
+        doc.write(chunk);
+    };
+}
+
+// Built once; toLocaleDateString() sets up a new locale formatter on every call
+const createdDateFormat = new Intl.DateTimeFormat();
+
+function formatCreatedDate(createdAt) {
+    const date = new Date(createdAt);
+    // format() throws on an unparseable date; keep toLocaleDateString()'s text instead
+    return isNaN(date.getTime()) ? 'Invalid Date' : createdDateFormat.format(date);
+}
+
+function conceptRowMarkup(entry) {
+    return `
+        <div class="concept-name">${entry.concept_name}</div>
+        <div class="concept-meta">
+            QA: ${entry.qa_id || 'N/A'} | 
+            Type: ${entry.concept_type || 'qa_file'} |
+            Created: ${entry.created_at ? formatCreatedDate(entry.created_at) : 'Unknown'}
+        </div>
+    `;
+}
+
+function renderQuarantineList(entries) {
+    const listEl = dom.quarantineList;
+
+    if (entries.length === 0) {
+        conceptItemIndex.clear();
+        listEl.innerHTML = '<div class="empty-state">No concepts in quarantine</div>';
+        return;
+    }
+
+    // Reuse existing rows by concept name; only new or changed rows touch innerHTML
+    const currentNames = new Set();
+    const items = entries.map(entry => {
+        const conceptName = entry.concept_name;
+        currentNames.add(conceptName);
+
+        let item = conceptItemIndex.get(conceptName);
+        if (!item) {
+            item = document.createElement('div');
+            item.className = 'concept-item';
+            item.dataset.conceptName = conceptName;
+            item.addEventListener('click', () => selectConcept(conceptName));
+            conceptItemIndex.set(conceptName, item);
+        }
+
+        const markup = conceptRowMarkup(entry);
+        if (renderedRowMarkup.get(item) !== markup) {
+            item.innerHTML = markup;
+            renderedRowMarkup.set(item, markup);
+        }
+        return item;
+    });
+
+    for (const conceptName of conceptItemIndex.keys()) {
+        if (!currentNames.has(conceptName)) {
+            conceptItemIndex.delete(conceptName);
+        }
+    }
+
+    listEl.replaceChildren(...items);
+}
+
+// Move the selection highlight by touching only the previous and the new row
+function highlightConceptItem(conceptName) {
+    conceptItemIndex.get(highlightedConcept)?.classList.remove('selected');
+    conceptItemIndex.get(conceptName)?.classList.add('selected');
+    highlightedConcept = conceptName;
+}
+
+async function selectConcept(conceptName) {
+    // Update UI selection
+    highlightConceptItem(conceptName);
+
+    currentConcept = conceptName;
+
+    try {
+        showStatus('Loading concept content from GitHub...', 'info');
+
+        const contentEl = dom.conceptContent;
+        const actionsEl = dom.conceptActions;
+
+        // Load concept content from GitHub repo (or the prefetch cache)
+        const result = await fetchConceptContent(conceptName, progressiveConceptRenderer(conceptName, contentEl));
+
+        if (result.html) {
+            renderConceptContent(conceptName, result.html, contentEl);
+        } else {
+            contentEl.innerHTML = `
+                <div class="markdown-content">
+                    <h2>${conceptName}</h2>
+                    <p><em>Content not available (${result.error || 'Unknown error'})</em></p>
+                    <p><strong>Note:</strong> Concept will be cloned from GitHub when approved.</p>
+                </div>
+            `;
+        }
+
+        actionsEl.style.display = 'flex';
+        showStatus('Concept loaded from GitHub', 'success');
+
+    } catch (error) {
+        showError('Failed to load concept content from GitHub: ' + error.message);
+    }
+}
+
+// Write endpoints answer with a queued job record; poll it until the GitHub push settles
+async function waitForJob(job) {
+    while (job.status === 'running') {
+        await new Promise(resolve => setTimeout(resolve, 1000));
+        const response = await fetch(`/api/jobs/${encodeURIComponent(job.job_id)}`);
+        job = await response.json();
+    }
+    return job;
+}
+
+async function approveConcept() {
+    if (!currentConcept) return;
+
+    if (!confirm(`Approve "${currentConcept}" for public publishing?\n\nThis will:\n1. Clone Carton repo from GitHub\n2. Update authorized.json\n3. Commit and push to GitHub`)) return;
+
+    try {
+        showActionStatus('Approving via GitHub...', 'info');
+
+        const response = await fetch(`/api/approve/${encodeURIComponent(currentConcept)}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ reviewer: 'isaac' })
+        });
+
+        const result = await waitForJob(await response.json());
+
+        if (result.success) {
+            showActionStatus('✅ Approved and pushed to GitHub!', 'success');
+            // Remove from quarantine list
+            setTimeout(() => {
+                resetConceptView();
+            }, 2000);
+        } else {
+            showActionStatus('❌ Approval failed: ' + (result.error || 'Unknown error'), 'error');
+        }
+
+    } catch (error) {
+        showActionStatus('❌ Approval failed: ' + error.message, 'error');
+    }
+}
+
+async function rejectConcept() {
+    if (!currentConcept) return;
+
+    const reason = prompt(`Reject "${currentConcept}" - Reason:`, 'Not suitable for publication');
+    if (!reason) return;
+
+    try {
+        showActionStatus('Rejecting via GitHub...', 'info');
+
+        const response = await fetch(`/api/reject/${encodeURIComponent(currentConcept)}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ reason: reason })
+        });
+
+        const result = await waitForJob(await response.json());
+
+        if (result.success) {
+            showActionStatus('✅ Rejected and pushed to GitHub!', 'success');
+            // Remove from quarantine list  
+            setTimeout(() => {
+                resetConceptView();
+            }, 2000);
+        } else {
+            showActionStatus('❌ Rejection failed: ' + (result.error || 'Unknown error'), 'error');
+        }
+
+    } catch (error) {
+        showActionStatus('❌ Rejection failed: ' + error.message, 'error');
+    }
+}
+
+async function needsRevisionConcept() {
+    if (!currentConcept) return;
+
+    const reason = prompt(`Mark "${currentConcept}" as needs revision - Reason:`, 'Requires content revision before publication');
+    if (!reason) return;
+
+    try {
+        showActionStatus('Marking as needs revision via GitHub...', 'info');
+
+        const response = await fetch(`/api/needs_revision/${encodeURIComponent(currentConcept)}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ reason: reason })
+        });
+
+        const result = await waitForJob(await response.json());
+
+        if (result.success) {
+            showActionStatus('✅ Marked as needs revision!', 'success');
+            setTimeout(() => {
+                resetConceptView();
+            }, 2000);
+        } else {
+            showActionStatus('❌ Failed to mark as needs revision: ' + (result.error || 'Unknown error'), 'error');
+        }
+
+    } catch (error) {
+        showActionStatus('❌ Failed to mark as needs revision: ' + error.message, 'error');
+    }
+}
+
+async function needsRedactConcept() {
+    if (!currentConcept) return;
+
+    const reason = prompt(`Mark "${currentConcept}" as needs redaction - Reason:`, 'Contains sensitive information requiring redaction');
+    if (!reason) return;
+
+    try {
+        showActionStatus('Marking as needs redaction via GitHub...', 'info');
+
+        const response = await fetch(`/api/needs_redact/${encodeURIComponent(currentConcept)}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ reason: reason })
+        });
+
+        const result = await waitForJob(await response.json());
+
+        if (result.success) {
+            showActionStatus('✅ Marked as needs redaction!', 'success');
+            setTimeout(() => {
+                resetConceptView();
+            }, 2000);
+        } else {
+            showActionStatus('❌ Failed to mark as needs redaction: ' + (result.error || 'Unknown error'), 'error');
+        }
+
+    } catch (error) {
+        showActionStatus('❌ Failed to mark as needs redaction: ' + error.message, 'error');
+    }
+}
+
+async function syncWithGitHub() {
+    try {
+        showStatus('Pushing authorized.json to GitHub...', 'info');
+
+        const response = await fetch('/api/sync', { method: 'POST' });
+        const result = await waitForJob(await response.json());
+
+        if (result.success) {
+            showStatus('✅ Pushed to GitHub successfully', 'success');
+        } else {
+            showStatus('❌ GitHub push failed: ' + (result.error || 'Unknown error'), 'error');
+        }
+
+    } catch (error) {
+        showStatus('❌ GitHub push failed: ' + error.message, 'error');
+    }
+}
+
+async function publishToPublic() {
+    if (!confirm('Publish all authorized concepts to public branch?\n\nThis will:\n1. Detect changed content since last publication\n2. Run auto-redaction on changed files\n3. Apply all redaction rules\n4. Publish to #public branch\n\nThis may take several minutes.')) {
+        return;
+    }
+
+    try {
+        showStatus('🚀 Starting auto-redaction and publishing workflow...', 'info');
+
+        const response = await fetch('/api/publish_to_public', { 
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' }
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            showStatus(`✅ Published successfully! ${result.files_processed} files processed, ${result.rules_added} redaction rules added`, 'success');
+        } else {
+            showStatus('❌ Publishing failed: ' + (result.error || 'Unknown error'), 'error');
+        }
+
+    } catch (error) {
+        showStatus('❌ Publishing failed: ' + error.message, 'error');
+    }
+}
+
+function resetConceptView() {
+    // With EventSource the server's change event drives the refresh
+    if (!window.EventSource) refreshQuarantine();
+    currentConcept = null;
+    dom.conceptContent.innerHTML = '<div class="empty-state">Select a concept from the list to preview its content from GitHub</div>';
+    dom.conceptActions.style.display = 'none';
+}
+
+function clearStatusAfterDelay(statusEl, delay = 3000) {
+    setTimeout(() => {
+        statusEl.textContent = '';
+        statusEl.className = 'status-text';
+    }, delay);
+}
+
+function showStatus(message, type = 'info') {
+    const statusEl = dom.status;
+    statusEl.textContent = message;
+    statusEl.className = `status-text ${type}`;
+
+    if (type === 'success' || type === 'error') {
+        clearStatusAfterDelay(statusEl);
+    }
+}
+
+function showActionStatus(message, type = 'info') {
+    const statusEl = dom.actionStatus;
+    statusEl.textContent = message;
+    statusEl.className = `status-text ${type}`;
+
+    if (type === 'success' || type === 'error') {
+        clearStatusAfterDelay(statusEl);
+    }
+}
+
+function showError(message) {
+    const listEl = dom.quarantineList;
+    listEl.innerHTML = `<div class="error">${message}</div>`;
+}
+
+function scrollToTopOfConceptPreview() {
+    // Try multiple scroll targets and methods
+    const conceptPreview = dom.conceptPreview;
+    const conceptContent = dom.conceptContent;
+
+    console.log('Attempting to scroll to top...');
+    console.log('conceptPreview element:', conceptPreview);
+    console.log('conceptContent element:', conceptContent);
+
+    // Try scrolling the concept preview container
+    if (conceptPreview) {
+        console.log('Before scroll - conceptPreview.scrollTop:', conceptPreview.scrollTop);
+        conceptPreview.scrollTop = 0;
+        conceptPreview.scrollTo(0, 0);
+        console.log('After scroll - conceptPreview.scrollTop:', conceptPreview.scrollTop);
+    }
+
+    // Also try scrolling the content element
+    if (conceptContent) {
+        conceptContent.scrollTop = 0;
+        conceptContent.scrollTo(0, 0);
+    }
+
+    // Force scroll the main window as backup
+    window.scrollTo(0, 0);
+
+    console.log('Scroll attempt completed');
+}
+
+function renderConceptContent(conceptName, htmlContent, contentEl) {
+    // Markdown is rendered to HTML server-side
+
+    contentEl.innerHTML = `
+        <div class="markdown-content">
+            <div class="concept-header">
+                <h2>${conceptName}</h2>
+                <p><em>Content loaded from GitHub repo</em></p>
+            </div>
+            ${htmlContent}
+        </div>
+    `;
+
+    // Scroll to top of the concept preview area
+    scrollToTopOfConceptPreview();
+
+    // Mark concept links so the delegated click handler keeps them in the interface
+    markConceptLinks(contentEl);
+}
+
+function markConceptLinks(contentEl) {
+    // Find all links that look like concept links
+    const links = contentEl.querySelectorAll('a[href*=".md"]');
+
+    links.forEach(link => {
+        const href = link.getAttribute('href');
+
+        // Check if it's a concept link pattern: /ConceptName/ConceptName_itself.md
+        const conceptMatch = href.match(/\/([^\/]+)\/[^\/]+\.md$/);
+        if (conceptMatch) {
+            const conceptName = conceptMatch[1];
+            link.dataset.concept = conceptName;
+            link.classList.add('internal-link');
+            link.title = `Click to view ${conceptName} in this interface`;
+        }
+    });
+}
+
+// One listener on the preview pane handles every internal link, however often it re-renders
+function handleConceptLinkClick(e) {
+    const link = e.target.closest('a[data-concept]');
+    if (!link) return;
+
+    // Prevent default link behavior and load in our interface instead
+    e.preventDefault();
+    const conceptName = link.dataset.concept;
+
+    // Update the quarantine list selection (if concept exists there)
+    highlightConceptItem(conceptName);
+
+    // Load the concept content
+    selectConceptByName(conceptName);
+}
+
+async function selectConceptByName(conceptName) {
+    currentConcept = conceptName;
+
+    try {
+        showStatus('Loading linked concept...', 'info');
+
+        const contentEl = dom.conceptContent;
+        const actionsEl = dom.conceptActions;
+
+        // Load concept content
+        const result = await fetchConceptContent(conceptName, progressiveConceptRenderer(conceptName, contentEl));
+
+        if (result.html) {
+            renderConceptContent(conceptName, result.html, contentEl);
+        } else {
+            contentEl.innerHTML = `
+                <div class="markdown-content">
+                    <h2>${conceptName}</h2>
+                    <p><em>Content not available (${result.error || 'Unknown error'})</em></p>
+                    <p><strong>Note:</strong> Concept will be cloned from GitHub when approved.</p>
+                </div>
+            `;
+            // Ensure scroll to top even when content is not available
+            scrollToTopOfConceptPreview();
+        }
+
+        actionsEl.style.display = 'flex';
+        showStatus('Linked concept loaded', 'success');
+
+    } catch (error) {
+        showError('Failed to load linked concept: ' + error.message);
+    }
+}
+
+// Redaction Management Functions
+function toggleRedactionPanel() {
+    const panel = document.getElementById('redaction-panel');
+    if (panel.style.display === 'none') {
+        panel.style.display = 'block';
+        loadRedactionRules();
+    } else {
+        panel.style.display = 'none';
+    }
+}
+
+// Built with textContent so rule terms are never parsed as HTML
+function ruleRowElement(term, replacement) {
+    const termEl = document.createElement('span');
+    termEl.className = 'rule-term';
+    termEl.textContent = term;
+
+    const arrowEl = document.createElement('span');
+    arrowEl.className = 'rule-arrow';
+    arrowEl.textContent = '→';
+
+    const replacementEl = document.createElement('span');
+    replacementEl.className = 'rule-replacement';
+    replacementEl.textContent = replacement;
+
+    const labelEl = document.createElement('div');
+    labelEl.append(termEl, arrowEl, replacementEl);
+
+    const removeButton = document.createElement('button');
+    removeButton.className = 'btn-remove';
+    removeButton.dataset.term = term;
+    removeButton.textContent = '✕';
+
+    const row = document.createElement('div');
+    row.className = 'rule-item';
+    row.append(labelEl, removeButton);
+    return row;
+}
+
+function showNoRedactionRules() {
+    dom.rulesList.innerHTML = '<div class="empty-state">No redaction rules configured</div>';
+}
+
+// After a successful add, insert or replace just that rule's row
+function upsertRuleRow(term, replacement) {
+    const row = ruleRowElement(term, replacement);
+    const existing = ruleRowIndex.get(term);
+    if (existing) {
+        existing.replaceWith(row);
+    } else {
+        if (ruleRowIndex.size === 0) dom.rulesList.replaceChildren();
+        dom.rulesList.appendChild(row);
+    }
+    ruleRowIndex.set(term, row);
+}
+
+// After a successful remove, drop just that rule's row
+function removeRuleRow(term) {
+    ruleRowIndex.get(term)?.remove();
+    ruleRowIndex.delete(term);
+    if (ruleRowIndex.size === 0) showNoRedactionRules();
+}
+
+// One listener on the rules list serves every remove button
+function handleRuleListClick(e) {
+    const button = e.target.closest('.btn-remove[data-term]');
+    if (button) {
+        removeRedactionRule(button.dataset.term);
+    }
+}
+
+async function loadRedactionRules() {
+    try {
+        const response = await fetch('/api/redaction/rules');
+        const data = await response.json();
+
+        const rulesListEl = dom.rulesList;
+        ruleRowIndex.clear();
+        if (Object.keys(data.rules).length === 0) {
+            showNoRedactionRules();
+            return;
+        }
+
+        const fragment = document.createDocumentFragment();
+        for (const [term, replacement] of Object.entries(data.rules)) {
+            const row = ruleRowElement(term, replacement);
+            ruleRowIndex.set(term, row);
+            fragment.appendChild(row);
+        }
+        rulesListEl.replaceChildren(fragment);
+    } catch (error) {
+        dom.rulesList.innerHTML = 
+            '<div class="error">Failed to load redaction rules</div>';
+    }
+}
+
+async function addRedactionRule() {
+    const termInput = document.getElementById('new-term');
+    const replacementInput = document.getElementById('new-replacement');
+
+    const term = termInput.value.trim();
+    if (!term) {
+        showError('Please enter a term to redact');
+        return;
+    }
+
+    const replacement = replacementInput.value.trim() || '[REDACTED]';
+
+    try {
+        const response = await fetch('/api/redaction/rules', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                sensitive_term: term,
+                replacement: replacement
+            })
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            termInput.value = '';
+            replacementInput.value = '';
+            upsertRuleRow(term, replacement);
+            showStatus('Redaction rule added successfully', 'success');
+        } else {
+            showError(result.error || 'Failed to add redaction rule');
+        }
+    } catch (error) {
+        showError('Error adding redaction rule: ' + error.message);
+    }
+}
+
+async function removeRedactionRule(term) {
+    if (!confirm(`Remove redaction rule for "${term}"?`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/redaction/rules/${encodeURIComponent(term)}`, {
+            method: 'DELETE'
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            removeRuleRow(term);
+            showStatus('Redaction rule removed successfully', 'success');
+        } else {
+            showError(result.error || 'Failed to remove redaction rule');
+        }
+    } catch (error) {
+        showError('Error removing redaction rule: ' + error.message);
+    }
+}
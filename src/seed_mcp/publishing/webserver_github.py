@@ -4,20 +4,52 @@ SEED v0 Publishing Platform - GitHub-Based Webserver
 Stateless webserver that uses GitHub as transport layer for Carton operations.
 """
 
+import asyncio
+import functools
+import gzip
+import hashlib
 import os
 import sys
-import traceback
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple, Type, TypeVar
+from urllib.parse import parse_qs
 import logging
 from datetime import datetime
 
 # Add current directory to path for imports
 sys.path.insert(0, '/home/GOD/seed_v0_publishing')
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
+from jinja2 import Environment, FileSystemLoader
+from markdown_it import MarkdownIt
+import msgspec
 from pydantic import BaseModel
+from sse_starlette import EventSourceResponse
+
+try:
+    import brotli
+except ImportError:  # optional: without it the dashboard is served gzip or raw
+    brotli = None
+
+try:
+    import orjson
+except ImportError:  # optional: without it JSON responses are encoded by msgspec
+    orjson = None
+
+try:
+    import rcssmin
+except ImportError:  # optional: without it the inlined CSS is left unminified
+    rcssmin = None
 
 # Import our corrected single authorized.json quarantine system
 from seed_quarantine_github_v2 import GitHubQuarantineManager
@@ -28,962 +60,514 @@ from auto_redaction_workflow import AutoRedactionWorkflow
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_manager: Optional[GitHubQuarantineManager] = None
+_manager_lock = threading.Lock()
+
+def get_manager() -> GitHubQuarantineManager:
+    """Create the GitHub-based quarantine manager on first use."""
+    global _manager
+    # The startup warmup and the first request can both get here; only one may clone
+    with _manager_lock:
+        if _manager is None:
+            _manager = GitHubQuarantineManager(
+                github_pat=os.environ.get('GITHUB_PAT'),
+                carton_repo_url=os.environ.get('CARTON_REPO_URL')
+            )
+        return _manager
+
+def _log_warmup_failure(future: asyncio.Future) -> None:
+    """Report a failed startup warmup; the first request will retry the construction."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Quarantine manager warmup failed: {future.exception()}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the quarantine manager in the background so startup is not blocked on it."""
+    warmup = asyncio.get_running_loop().run_in_executor(None, get_manager)
+    warmup.add_done_callback(_log_warmup_failure)
+    yield
+    # Let queued clone/commit/push jobs finish before the process exits
+    git_executor.shutdown(wait=True)
+
+# Same encoder as the default response class, for bodies serialized ahead of time
+encode_json = orjson.dumps if orjson else msgspec.json.encode
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response encoded by msgspec, already a dependency, instead of the stdlib encoder."""
+    
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SEED GitHub Quarantine Manager",
     description="GitHub-based web interface for reviewing and approving quarantined concepts",
-    version="0.2.0"
-)
-
-# Initialize GitHub-based quarantine manager
-manager = GitHubQuarantineManager(
-    github_pat=os.environ.get('GITHUB_PAT'),
-    carton_repo_url=os.environ.get('CARTON_REPO_URL')
+    version="0.2.0",
+    default_response_class=ORJSONResponse if orjson else MsgspecJSONResponse,
+    lifespan=lifespan
 )
+# Compresses JSON and streamed HTML; responses that already set Content-Encoding (the
+# precompressed index) and the text/event-stream SSE feed are passed through untouched
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
 # Initialize redaction manager
 redaction_manager = RedactionManager("redacted.json")
 
-# Pydantic models for request/response
-class ApprovalRequest(BaseModel):
+class VersionedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache content-versioned URLs (?v=<hash>) indefinitely."""
+    
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            # Only the current hash is immutable; a stale or made-up ?v= must not be pinned for a year
+            versions = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("v")
+            if versions and versions[0] == asset_digest(path):
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+# Dashboard assets (scripts) are served straight from disk by Starlette
+STATIC_DIR = Path(__file__).parent / "static"
+app.mount("/static", VersionedStaticFiles(directory=str(STATIC_DIR)), name="static")
+
+# Asset content hashes keyed by path, recomputed only when the file's (mtime, size) changes
+_asset_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+def asset_digest(asset_path: str) -> str:
+    """Short hash of a static asset's current content."""
+    path = STATIC_DIR / asset_path
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _asset_digests.get(asset_path)
+    if cached is None or cached[0] != signature:
+        cached = (signature, hashlib.sha256(path.read_bytes()).hexdigest()[:12])
+        _asset_digests[asset_path] = cached
+    return cached[1]
+
+def static_url(asset_path: str) -> str:
+    """URL for a static asset, versioned by a hash of its content so it can be cached forever."""
+    return f"/static/{asset_path}?v={asset_digest(asset_path)}"
+
+def content_etag(data: bytes) -> str:
+    """Strong ETag derived from a hash of the response body."""
+    return f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check If-None-Match, which may list several tags, possibly weak (W/) after a proxy recompressed them."""
+    if_none_match = request.headers.get("if-none-match", "")
+    return if_none_match == "*" or etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+def accepted_encodings(request: Request) -> Set[str]:
+    """Content codings the client accepts per Accept-Encoding, honouring q=0 refusals and '*'."""
+    qualities: Dict[str, float] = {}
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    
+    accepted = {coding for coding, quality in qualities.items() if quality > 0}
+    if qualities.get("*", 0) > 0:
+        # '*' covers every coding not listed explicitly
+        accepted |= {coding for coding in ("br", "gzip") if coding not in qualities}
+    return accepted
+
+# The dashboard page is fully static: render it once at import and serve the bytes
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+templates_env = Environment(
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    auto_reload=False
+)
+# Critical CSS is minified once here and inlined into the page
+_INLINE_CSS = (TEMPLATES_DIR / "dashboard.css").read_text(encoding="utf-8")
+if rcssmin:
+    _INLINE_CSS = rcssmin.cssmin(_INLINE_CSS)
+_INDEX_HTML = templates_env.get_template("index.html").render(
+    static_url=static_url,
+    inline_css=_INLINE_CSS
+).encode("utf-8")
+_INDEX_ETAG = content_etag(_INDEX_HTML)
+# Short max-age so a redeploy's new asset hashes are picked up quickly; revalidation is a 304
+_INDEX_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "public, max-age=60, must-revalidate", "Vary": "Accept-Encoding"}
+# Precompressed variants so root() never compresses per request
+_INDEX_GZIP = gzip.compress(_INDEX_HTML, 9)
+_INDEX_BROTLI = brotli.compress(_INDEX_HTML, quality=11) if brotli else None
+
+class TTLCache:
+    """Small LRU cache whose entries expire a fixed number of seconds after being stored."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+
+# Short-lived caches in front of GitHub-backed reads; cleared by every write endpoint
+concept_content_cache = TTLCache(maxsize=512, ttl=60)
+quarantine_cache = TTLCache(maxsize=1, ttl=10)
+
+# Concept markdown is rendered server-side once per content version
+markdown_renderer = MarkdownIt("commonmark", {"html": False}).enable(["table", "strikethrough"])
+
+HTML_CHUNK_SIZE = 16384
+# Concept responses always revalidate; an unchanged concept costs a bodiless 304
+_CONCEPT_CACHE_HEADERS = {"Cache-Control": "no-cache"}
+
+@functools.lru_cache(maxsize=1024)
+def render_markdown(content: str) -> str:
+    """Render concept markdown to HTML, memoized on the markdown text itself."""
+    return markdown_renderer.render(content)
+
+# All manager calls share one clone directory, so they run one at a time on a
+# dedicated thread instead of blocking the event loop
+git_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="carton-git")
+
+async def _run(fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking manager call on the git thread and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(git_executor, functools.partial(fn, *args, **kwargs))
+
+# Concept reads already on their way to the git thread; concurrent misses await the same task
+_pending_concept_reads: Dict[str, asyncio.Task] = {}
+
+async def _load_concept_content(manager: GitHubQuarantineManager, concept_name: str) -> Dict[str, Any]:
+    """Read a concept from the repo clone, render it, and cache successful results."""
+    result = await _run(manager.get_concept_content, concept_name)
+    if "error" not in result:
+        html = render_markdown(result["content"])
+        result = {**result, "html": html, "etag": content_etag(html.encode())}
+        concept_content_cache.set(concept_name, result)
+    return result
+
+async def get_cached_concept_content(manager: GitHubQuarantineManager, concept_name: str) -> Dict[str, Any]:
+    """Get concept content with rendered HTML, serving successful reads from the TTL cache."""
+    result = concept_content_cache.get(concept_name)
+    if result is not None:
+        return result
+    
+    task = _pending_concept_reads.get(concept_name)
+    if task is None:
+        task = asyncio.create_task(_load_concept_content(manager, concept_name))
+        _pending_concept_reads[concept_name] = task
+        task.add_done_callback(lambda _: _pending_concept_reads.pop(concept_name, None))
+    # Shielded so one client disconnecting does not cancel the read for the others
+    return await asyncio.shield(task)
+
+# The quarantine read on its way to the git thread; every tab refetching after an SSE
+# event awaits this one task instead of queueing its own fetch/reset/clean
+_pending_quarantine_read: Optional[asyncio.Task] = None
+# Bumped by every invalidation so a read that started before a write is not cached after it
+_quarantine_generation = 0
+
+async def _load_quarantine(manager: GitHubQuarantineManager, generation: int) -> Tuple[int, bytes]:
+    """Read the quarantine list from the repo clone and cache it unless a write has since landed."""
+    entries = await _run(manager.publishing_review_quarantine)
+    cached = (len(entries), encode_json(entries))
+    if generation == _quarantine_generation:
+        quarantine_cache.set("entries", cached)
+    return cached
+
+def _clear_pending_quarantine_read(task: asyncio.Task) -> None:
+    global _pending_quarantine_read
+    if _pending_quarantine_read is task:
+        _pending_quarantine_read = None
+
+async def get_cached_quarantine(manager: GitHubQuarantineManager) -> Tuple[int, bytes]:
+    """Get the quarantine entry count and JSON body, serializing once per cache fill."""
+    global _pending_quarantine_read
+    cached = quarantine_cache.get("entries")
+    if cached is not None:
+        return cached
+    
+    task = _pending_quarantine_read
+    if task is None:
+        task = asyncio.create_task(_load_quarantine(manager, _quarantine_generation))
+        _pending_quarantine_read = task
+        task.add_done_callback(_clear_pending_quarantine_read)
+    # Shielded so one client disconnecting does not cancel the read for the others
+    return await asyncio.shield(task)
+
+def invalidate_read_caches() -> None:
+    """Drop cached GitHub reads after a write so the next request sees fresh data."""
+    global _pending_quarantine_read, _quarantine_generation
+    concept_content_cache.clear()
+    quarantine_cache.clear()
+    # A read already in flight may predate the write; later requests start a fresh one
+    _quarantine_generation += 1
+    _pending_quarantine_read = None
+    notify_quarantine_subscribers()
+
+# One queue per open /api/quarantine/stream connection; a pending event is never duplicated
+quarantine_subscribers: Set[asyncio.Queue] = set()
+SSE_KEEPALIVE_SECONDS = 15
+
+def notify_quarantine_subscribers() -> None:
+    """Tell every connected dashboard that the quarantine list has changed."""
+    for queue in quarantine_subscribers:
+        try:
+            queue.put_nowait("quarantine")
+        except asyncio.QueueFull:
+            pass
+
+# Background write jobs by id. Running jobs are held until they finish so they can never
+# be evicted; finished jobs then stay pollable at /api/jobs/{id} for an hour
+running_jobs: Dict[str, Dict[str, Any]] = {}
+jobs = TTLCache(maxsize=256, ttl=3600)
+_running_job_tasks: Set[asyncio.Task] = set()
+
+def start_job(success_message: str, error_message: str, fn: Callable, *args: Any) -> Dict[str, Any]:
+    """Queue a GitHub write on the git thread and return its job record straight away."""
+    job_id = uuid.uuid4().hex
+    job = {"job_id": job_id, "status": "running"}
+    running_jobs[job_id] = job
+    
+    async def run_job() -> None:
+        try:
+            if await _run(fn, *args):
+                logger.info(f"Job {job_id} finished: {success_message}")
+                job.update(status="done", success=True, message=success_message)
+            else:
+                logger.error(f"Job {job_id} failed: {error_message}")
+                job.update(status="failed", success=False, error=error_message)
+        except Exception as e:
+            logger.error(f"Job {job_id} raised: {e}")
+            logger.debug("Traceback", exc_info=True)
+            job.update(status="failed", success=False, error=str(e))
+        finally:
+            jobs.set(job_id, running_jobs.pop(job_id))
+            invalidate_read_caches()
+    
+    task = asyncio.create_task(run_job())
+    _running_job_tasks.add(task)
+    task.add_done_callback(_running_job_tasks.discard)
+    return dict(job)
+
+# Request bodies are flat string structs, decoded and validated by msgspec in one pass
+class ApprovalRequest(msgspec.Struct):
     reviewer: str = "isaac"
     reason: Optional[str] = None
 
-class RejectionRequest(BaseModel):
+class RejectionRequest(msgspec.Struct):
     reason: str = "Not suitable for publication"
 
+class RedactionRuleRequest(msgspec.Struct):
+    sensitive_term: str
+    replacement: str = "[REDACTED]"
+
+class ConceptNamesRequest(msgspec.Struct):
+    names: List[str]
+
+RequestT = TypeVar("RequestT")
+
+def json_body(model: Type[RequestT]) -> Callable:
+    """FastAPI dependency that decodes a JSON request body straight into a msgspec Struct."""
+    decoder = msgspec.json.Decoder(model)
+    
+    async def decode_body(request: Request) -> RequestT:
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    
+    return decode_body
+
+# Pydantic models for responses
 class ConceptStatusResponse(BaseModel):
     concept_name: str
     status: Optional[str]
     in_quarantine: bool
 
-class RedactionRuleRequest(BaseModel):
-    sensitive_term: str
-    replacement: str = "[REDACTED]"
-
 class RedactionRuleResponse(BaseModel):
     rules: Dict[str, str]
 
 # API Routes
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the main HTML interface."""
-    html_content = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>SEED GitHub Quarantine Manager</title>
-        <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
-        <style>
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                margin: 0;
-                padding: 20px;
-                background-color: #f5f5f5;
-            }
-            .container {
-                max-width: 1200px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 8px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                overflow: hidden;
-            }
-            .header {
-                background: #059669;
-                color: white;
-                padding: 20px;
-                text-align: center;
-            }
-            .github-badge {
-                background: rgba(255,255,255,0.2);
-                padding: 4px 8px;
-                border-radius: 4px;
-                font-size: 12px;
-                margin-left: 10px;
-            }
-            .controls {
-                padding: 20px;
-                border-bottom: 1px solid #e5e5e5;
-                display: flex;
-                gap: 10px;
-                align-items: center;
-            }
-            .btn {
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                cursor: pointer;
-                font-size: 14px;
-                transition: background-color 0.2s;
-            }
-            .btn-primary { background: #059669; color: white; }
-            .btn-success { background: #10b981; color: white; }
-            .btn-danger { background: #ef4444; color: white; }
-            .btn-secondary { background: #6b7280; color: white; }
-            .btn:hover { opacity: 0.9; }
-            .btn:disabled { opacity: 0.5; cursor: not-allowed; }
-            .content {
-                display: flex;
-                min-height: 600px;
-            }
-            .quarantine-list {
-                width: 400px;
-                border-right: 1px solid #e5e5e5;
-                overflow-y: auto;
-            }
-            .concept-item {
-                padding: 15px;
-                border-bottom: 1px solid #e5e5e5;
-                cursor: pointer;
-                transition: background-color 0.2s;
-            }
-            .concept-item:hover { background-color: #f9fafb; }
-            .concept-item.selected { background-color: #ecfdf5; border-left: 3px solid #059669; }
-            .concept-name { font-weight: 600; margin-bottom: 5px; }
-            .concept-meta { font-size: 12px; color: #6b7280; }
-            .concept-preview {
-                flex: 1;
-                padding: 20px;
-                overflow-y: auto;
-            }
-            .concept-actions {
-                padding: 20px;
-                border-top: 1px solid #e5e5e5;
-                display: flex;
-                gap: 10px;
-                align-items: center;
-            }
-            .markdown-content {
-                line-height: 1.6;
-                max-width: none;
-            }
-            .concept-header {
-                border-bottom: 2px solid #059669;
-                padding-bottom: 10px;
-                margin-bottom: 20px;
-            }
-            .concept-header h2 {
-                margin: 0;
-                color: #059669;
-            }
-            .concept-header p {
-                margin: 5px 0 0 0;
-                font-style: italic;
-                color: #6b7280;
-            }
-            .markdown-content h1, .markdown-content h2, .markdown-content h3 {
-                color: #1f2937;
-                margin-top: 1.5em;
-                margin-bottom: 0.5em;
-            }
-            .markdown-content code {
-                background: #f1f5f9;
-                padding: 2px 4px;
-                border-radius: 3px;
-                font-family: 'Monaco', 'Consolas', monospace;
-            }
-            .markdown-content pre {
-                background: #f8fafc;
-                border: 1px solid #e2e8f0;
-                border-radius: 6px;
-                padding: 16px;
-                overflow-x: auto;
-            }
-            .loading { text-align: center; padding: 40px; color: #6b7280; }
-            .error { color: #ef4444; padding: 20px; text-align: center; }
-            .success { color: #10b981; padding: 10px; text-align: center; }
-            .empty-state { 
-                text-align: center; 
-                padding: 40px; 
-                color: #6b7280;
-                font-style: italic;
-            }
-            .status-indicator {
-                display: inline-block;
-                width: 8px;
-                height: 8px;
-                border-radius: 50%;
-                margin-right: 8px;
-            }
-            .status-github { background: #059669; }
-            .info-box {
-                background: #ecfdf5;
-                border: 1px solid #059669;
-                border-radius: 4px;
-                padding: 12px;
-                margin-bottom: 16px;
-                font-size: 14px;
-            }
-            .redaction-panel {
-                border-top: 1px solid #e5e5e5;
-                background: #f9fafb;
-                padding: 20px;
-            }
-            .redaction-header h3 {
-                margin: 0 0 8px 0;
-                color: #374151;
-            }
-            .redaction-header p {
-                margin: 0 0 16px 0;
-                color: #6b7280;
-                font-size: 14px;
-            }
-            .add-rule-form {
-                display: flex;
-                gap: 10px;
-                margin-bottom: 20px;
-            }
-            .add-rule-form input {
-                padding: 8px 12px;
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            .add-rule-form input:first-child {
-                flex: 2;
-            }
-            .add-rule-form input:nth-child(2) {
-                flex: 1;
-            }
-            .rule-item {
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                padding: 12px;
-                background: white;
-                border: 1px solid #e5e5e5;
-                border-radius: 4px;
-                margin-bottom: 8px;
-            }
-            .rule-term {
-                font-family: 'Monaco', 'Consolas', monospace;
-                background: #f1f5f9;
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-weight: 600;
-            }
-            .rule-replacement {
-                font-family: 'Monaco', 'Consolas', monospace;
-                color: #ef4444;
-                font-weight: 600;
-            }
-            .btn-remove {
-                background: #ef4444;
-                color: white;
-                border: none;
-                padding: 4px 8px;
-                border-radius: 3px;
-                cursor: pointer;
-                font-size: 12px;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🔍 SEED GitHub Quarantine Manager</h1>
-                <p>Review and approve concepts for public publishing via GitHub
-                   <span class="github-badge">⚡ GitHub-based</span>
-                </p>
-            </div>
-            
-            <div class="info-box">
-                <span class="status-indicator status-github"></span>
-                <strong>GitHub Integration:</strong> This webserver clones your Carton repo from GitHub, 
-                performs CRUD operations on authorized.json, and pushes changes back. 
-                No local filesystem coupling required!
-            </div>
-            
-            <div class="controls">
-                <button class="btn btn-primary" onclick="refreshQuarantine()">🔄 Pull Fresh Data</button>
-                <button class="btn btn-secondary" onclick="syncWithGitHub()">🔀 Push to GitHub</button>
-                <button class="btn btn-secondary" onclick="toggleRedactionPanel()">🔒 Manage Redactions</button>
-                <button class="btn btn-success" onclick="publishToPublic()">🚀 Publish to Public</button>
-                <span id="status" class="status-text"></span>
-            </div>
-            
-            <!-- Redaction Management Panel (hidden by default) -->
-            <div id="redaction-panel" class="redaction-panel" style="display: none;">
-                <div class="redaction-header">
-                    <h3>🔒 Redaction Rules Management</h3>
-                    <p>Manage exact string matching rules for content redaction</p>
-                </div>
-                
-                <div class="redaction-content">
-                    <div class="redaction-controls">
-                        <div class="add-rule-form">
-                            <input type="text" id="new-term" placeholder="Term to redact..." />
-                            <input type="text" id="new-replacement" placeholder="Replacement (default: [REDACTED])" />
-                            <button class="btn btn-success" onclick="addRedactionRule()">+ Add Rule</button>
-                        </div>
-                    </div>
-                    
-                    <div class="rules-list" id="rules-list">
-                        <div class="loading">Loading redaction rules...</div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="content">
-                <div class="quarantine-list" id="quarantine-list">
-                    <div class="loading">Loading quarantine entries...</div>
-                </div>
-                
-                <div class="concept-preview">
-                    <div id="concept-content" class="empty-state">
-                        Select a concept from the list to preview its content from GitHub
-                    </div>
-                    
-                    <div class="concept-actions" id="concept-actions" style="display: none;">
-                        <button class="btn btn-success" onclick="approveConcept()" id="approve-btn">
-                            ✅ Approve for Publishing
-                        </button>
-                        <button class="btn btn-danger" onclick="rejectConcept()" id="reject-btn">
-                            ❌ Reject
-                        </button>
-                        <button class="btn btn-secondary" onclick="needsRevisionConcept()" id="needs-revision-btn">
-                            📝 Needs Revision
-                        </button>
-                        <button class="btn btn-secondary" onclick="needsRedactConcept()" id="needs-redact-btn">
-                            🔒 Needs Redaction
-                        </button>
-                        <span id="action-status"></span>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <script>
-            let currentConcept = null;
-            let quarantineEntries = [];
-
-            // Load quarantine entries on page load
-            document.addEventListener('DOMContentLoaded', function() {
-                refreshQuarantine();
-            });
-
-            async function refreshQuarantine() {
-                try {
-                    showStatus('Pulling fresh data from GitHub...', 'info');
-                    const response = await fetch('/api/quarantine');
-                    const entries = await response.json();
-                    
-                    quarantineEntries = entries;
-                    renderQuarantineList(entries);
-                    showStatus(`Pulled fresh data: ${entries.length} quarantine entries`, 'success');
-                } catch (error) {
-                    showError('Failed to pull fresh data: ' + error.message);
-                }
-            }
-
-            function renderQuarantineList(entries) {
-                const listEl = document.getElementById('quarantine-list');
-                
-                if (entries.length === 0) {
-                    listEl.innerHTML = '<div class="empty-state">No concepts in quarantine</div>';
-                    return;
-                }
-
-                const html = entries.map(entry => `
-                    <div class="concept-item" onclick="selectConcept('${entry.concept_name}')">
-                        <div class="concept-name">${entry.concept_name}</div>
-                        <div class="concept-meta">
-                            QA: ${entry.qa_id || 'N/A'} | 
-                            Type: ${entry.concept_type || 'qa_file'} |
-                            Created: ${entry.created_at ? new Date(entry.created_at).toLocaleDateString() : 'Unknown'}
-                        </div>
-                    </div>
-                `).join('');
-                
-                listEl.innerHTML = html;
-            }
-
-            async function selectConcept(conceptName) {
-                // Update UI selection
-                document.querySelectorAll('.concept-item').forEach(item => {
-                    item.classList.remove('selected');
-                });
-                event.target.closest('.concept-item').classList.add('selected');
-                
-                currentConcept = conceptName;
-                
-                try {
-                    showStatus('Loading concept content from GitHub...', 'info');
-                    
-                    // Load concept content from GitHub repo
-                    const response = await fetch(`/api/concept/${encodeURIComponent(conceptName)}/content`);
-                    const result = await response.json();
-                    
-                    const contentEl = document.getElementById('concept-content');
-                    const actionsEl = document.getElementById('concept-actions');
-                    
-                    if (result.content) {
-                        renderConceptContent(conceptName, result.content, contentEl);
-                    } else {
-                        contentEl.innerHTML = `
-                            <div class="markdown-content">
-                                <h2>${conceptName}</h2>
-                                <p><em>Content not available (${result.error || 'Unknown error'})</em></p>
-                                <p><strong>Note:</strong> Concept will be cloned from GitHub when approved.</p>
-                            </div>
-                        `;
-                    }
-                    
-                    actionsEl.style.display = 'flex';
-                    showStatus('Concept loaded from GitHub', 'success');
-                    
-                } catch (error) {
-                    showError('Failed to load concept content from GitHub: ' + error.message);
-                }
-            }
-
-            async function approveConcept() {
-                if (!currentConcept) return;
-                
-                if (!confirm(`Approve "${currentConcept}" for public publishing?\n\nThis will:\n1. Clone Carton repo from GitHub\n2. Update authorized.json\n3. Commit and push to GitHub`)) return;
-                
-                try {
-                    showActionStatus('Approving via GitHub...', 'info');
-                    
-                    const response = await fetch(`/api/approve/${encodeURIComponent(currentConcept)}`, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ reviewer: 'isaac' })
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        showActionStatus('✅ Approved and pushed to GitHub!', 'success');
-                        // Remove from quarantine list
-                        setTimeout(() => {
-                            resetConceptView();
-                        }, 2000);
-                    } else {
-                        showActionStatus('❌ Approval failed: ' + (result.error || 'Unknown error'), 'error');
-                    }
-                    
-                } catch (error) {
-                    showActionStatus('❌ Approval failed: ' + error.message, 'error');
-                }
-            }
-
-            async function rejectConcept() {
-                if (!currentConcept) return;
-                
-                const reason = prompt(`Reject "${currentConcept}" - Reason:`, 'Not suitable for publication');
-                if (!reason) return;
-                
-                try {
-                    showActionStatus('Rejecting via GitHub...', 'info');
-                    
-                    const response = await fetch(`/api/reject/${encodeURIComponent(currentConcept)}`, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ reason: reason })
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        showActionStatus('✅ Rejected and pushed to GitHub!', 'success');
-                        // Remove from quarantine list  
-                        setTimeout(() => {
-                            resetConceptView();
-                        }, 2000);
-                    } else {
-                        showActionStatus('❌ Rejection failed: ' + (result.error || 'Unknown error'), 'error');
-                    }
-                    
-                } catch (error) {
-                    showActionStatus('❌ Rejection failed: ' + error.message, 'error');
-                }
-            }
-
-            async function needsRevisionConcept() {
-                if (!currentConcept) return;
-                
-                const reason = prompt(`Mark "${currentConcept}" as needs revision - Reason:`, 'Requires content revision before publication');
-                if (!reason) return;
-                
-                try {
-                    showActionStatus('Marking as needs revision via GitHub...', 'info');
-                    
-                    const response = await fetch(`/api/needs_revision/${encodeURIComponent(currentConcept)}`, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ reason: reason })
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        showActionStatus('✅ Marked as needs revision!', 'success');
-                        setTimeout(() => {
-                            resetConceptView();
-                        }, 2000);
-                    } else {
-                        showActionStatus('❌ Failed to mark as needs revision: ' + (result.error || 'Unknown error'), 'error');
-                    }
-                    
-                } catch (error) {
-                    showActionStatus('❌ Failed to mark as needs revision: ' + error.message, 'error');
-                }
-            }
-
-            async function needsRedactConcept() {
-                if (!currentConcept) return;
-                
-                const reason = prompt(`Mark "${currentConcept}" as needs redaction - Reason:`, 'Contains sensitive information requiring redaction');
-                if (!reason) return;
-                
-                try {
-                    showActionStatus('Marking as needs redaction via GitHub...', 'info');
-                    
-                    const response = await fetch(`/api/needs_redact/${encodeURIComponent(currentConcept)}`, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ reason: reason })
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        showActionStatus('✅ Marked as needs redaction!', 'success');
-                        setTimeout(() => {
-                            resetConceptView();
-                        }, 2000);
-                    } else {
-                        showActionStatus('❌ Failed to mark as needs redaction: ' + (result.error || 'Unknown error'), 'error');
-                    }
-                    
-                } catch (error) {
-                    showActionStatus('❌ Failed to mark as needs redaction: ' + error.message, 'error');
-                }
-            }
-
-            async function syncWithGitHub() {
-                try {
-                    showStatus('Pushing authorized.json to GitHub...', 'info');
-                    
-                    const response = await fetch('/api/sync', { method: 'POST' });
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        showStatus('✅ Pushed to GitHub successfully', 'success');
-                    } else {
-                        showStatus('❌ GitHub push failed: ' + (result.error || 'Unknown error'), 'error');
-                    }
-                    
-                } catch (error) {
-                    showStatus('❌ GitHub push failed: ' + error.message, 'error');
-                }
-            }
-
-            async function publishToPublic() {
-                if (!confirm('Publish all authorized concepts to public branch?\\n\\nThis will:\\n1. Detect changed content since last publication\\n2. Run auto-redaction on changed files\\n3. Apply all redaction rules\\n4. Publish to #public branch\\n\\nThis may take several minutes.')) {
-                    return;
-                }
-
-                try {
-                    showStatus('🚀 Starting auto-redaction and publishing workflow...', 'info');
-                    
-                    const response = await fetch('/api/publish_to_public', { 
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' }
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        showStatus(`✅ Published successfully! ${result.files_processed} files processed, ${result.rules_added} redaction rules added`, 'success');
-                    } else {
-                        showStatus('❌ Publishing failed: ' + (result.error || 'Unknown error'), 'error');
-                    }
-                    
-                } catch (error) {
-                    showStatus('❌ Publishing failed: ' + error.message, 'error');
-                }
-            }
-
-            function resetConceptView() {
-                refreshQuarantine();
-                currentConcept = null;
-                document.getElementById('concept-content').innerHTML = '<div class="empty-state">Select a concept from the list to preview its content from GitHub</div>';
-                document.getElementById('concept-actions').style.display = 'none';
-            }
-
-            function clearStatusAfterDelay(statusEl, delay = 3000) {
-                setTimeout(() => {
-                    statusEl.textContent = '';
-                    statusEl.className = 'status-text';
-                }, delay);
-            }
-
-            function showStatus(message, type = 'info') {
-                const statusEl = document.getElementById('status');
-                statusEl.textContent = message;
-                statusEl.className = `status-text ${type}`;
-                
-                if (type === 'success' || type === 'error') {
-                    clearStatusAfterDelay(statusEl);
-                }
-            }
-
-            function showActionStatus(message, type = 'info') {
-                const statusEl = document.getElementById('action-status');
-                statusEl.textContent = message;
-                statusEl.className = `status-text ${type}`;
-                
-                if (type === 'success' || type === 'error') {
-                    clearStatusAfterDelay(statusEl);
-                }
-            }
-
-            function showError(message) {
-                const listEl = document.getElementById('quarantine-list');
-                listEl.innerHTML = `<div class="error">${message}</div>`;
-            }
-
-            function scrollToTopOfConceptPreview() {
-                // Try multiple scroll targets and methods
-                const conceptPreview = document.querySelector('.concept-preview');
-                const conceptContent = document.getElementById('concept-content');
-                
-                console.log('Attempting to scroll to top...');
-                console.log('conceptPreview element:', conceptPreview);
-                console.log('conceptContent element:', conceptContent);
-                
-                // Try scrolling the concept preview container
-                if (conceptPreview) {
-                    console.log('Before scroll - conceptPreview.scrollTop:', conceptPreview.scrollTop);
-                    conceptPreview.scrollTop = 0;
-                    conceptPreview.scrollTo(0, 0);
-                    console.log('After scroll - conceptPreview.scrollTop:', conceptPreview.scrollTop);
-                }
-                
-                // Also try scrolling the content element
-                if (conceptContent) {
-                    conceptContent.scrollTop = 0;
-                    conceptContent.scrollTo(0, 0);
-                }
-                
-                // Force scroll the main window as backup
-                window.scrollTo(0, 0);
-                
-                console.log('Scroll attempt completed');
-            }
-            
-            function renderConceptContent(conceptName, markdownContent, contentEl) {
-                // Proper markdown rendering using marked.js
-                const htmlContent = marked.parse(markdownContent);
-                
-                contentEl.innerHTML = `
-                    <div class="markdown-content">
-                        <div class="concept-header">
-                            <h2>${conceptName}</h2>
-                            <p><em>Content loaded from GitHub repo</em></p>
-                        </div>
-                        ${htmlContent}
-                    </div>
-                `;
-                
-                // Scroll to top of the concept preview area
-                scrollToTopOfConceptPreview();
-                
-                // Intercept concept links to keep them in the interface
-                interceptConceptLinks(contentEl);
-            }
-            
-            function interceptConceptLinks(contentEl) {
-                // Find all links that look like concept links
-                const links = contentEl.querySelectorAll('a[href*=".md"]');
-                
-                links.forEach(link => {
-                    const href = link.getAttribute('href');
-                    
-                    // Check if it's a concept link pattern: /ConceptName/ConceptName_itself.md
-                    const conceptMatch = href.match(/\/([^\/]+)\/[^\/]+\.md$/);
-                    if (conceptMatch) {
-                        const conceptName = conceptMatch[1];
-                        
-                        // Prevent default link behavior and load in our interface instead
-                        link.addEventListener('click', (e) => {
-                            e.preventDefault();
-                            
-                            // Update the quarantine list selection (if concept exists there)
-                            const conceptItems = document.querySelectorAll('.concept-item');
-                            conceptItems.forEach(item => {
-                                item.classList.remove('selected');
-                                if (item.textContent.includes(conceptName)) {
-                                    item.classList.add('selected');
-                                }
-                            });
-                            
-                            // Load the concept content
-                            selectConceptByName(conceptName);
-                        });
-                        
-                        // Add visual indicator that this is an internal link
-                        link.style.color = '#059669';
-                        link.style.fontWeight = '500';
-                        link.title = `Click to view ${conceptName} in this interface`;
-                    }
-                });
-            }
-            
-            async function selectConceptByName(conceptName) {
-                currentConcept = conceptName;
-                
-                try {
-                    showStatus('Loading linked concept...', 'info');
-                    
-                    // Load concept content
-                    const response = await fetch(`/api/concept/${encodeURIComponent(conceptName)}/content`);
-                    const result = await response.json();
-                    
-                    const contentEl = document.getElementById('concept-content');
-                    const actionsEl = document.getElementById('concept-actions');
-                    
-                    if (result.content) {
-                        renderConceptContent(conceptName, result.content, contentEl);
-                    } else {
-                        contentEl.innerHTML = `
-                            <div class="markdown-content">
-                                <h2>${conceptName}</h2>
-                                <p><em>Content not available (${result.error || 'Unknown error'})</em></p>
-                                <p><strong>Note:</strong> Concept will be cloned from GitHub when approved.</p>
-                            </div>
-                        `;
-                        // Ensure scroll to top even when content is not available
-                        scrollToTopOfConceptPreview();
-                    }
-                    
-                    actionsEl.style.display = 'flex';
-                    showStatus('Linked concept loaded', 'success');
-                    
-                } catch (error) {
-                    showError('Failed to load linked concept: ' + error.message);
-                }
-            }
-            
-            // Redaction Management Functions
-            function toggleRedactionPanel() {
-                const panel = document.getElementById('redaction-panel');
-                if (panel.style.display === 'none') {
-                    panel.style.display = 'block';
-                    loadRedactionRules();
-                } else {
-                    panel.style.display = 'none';
-                }
-            }
-            
-            async function loadRedactionRules() {
-                try {
-                    const response = await fetch('/api/redaction/rules');
-                    const data = await response.json();
-                    
-                    const rulesListEl = document.getElementById('rules-list');
-                    if (Object.keys(data.rules).length === 0) {
-                        rulesListEl.innerHTML = '<div class="empty-state">No redaction rules configured</div>';
-                        return;
-                    }
-                    
-                    rulesListEl.innerHTML = Object.entries(data.rules)
-                        .map(([term, replacement]) => `
-                            <div class="rule-item">
-                                <div>
-                                    <span class="rule-term">${term}</span>
-                                    <span style="margin: 0 8px;">→</span>
-                                    <span class="rule-replacement">${replacement}</span>
-                                </div>
-                                <button class="btn-remove" onclick="removeRedactionRule('${term}')">✕</button>
-                            </div>
-                        `).join('');
-                } catch (error) {
-                    document.getElementById('rules-list').innerHTML = 
-                        '<div class="error">Failed to load redaction rules</div>';
-                }
-            }
-            
-            async function addRedactionRule() {
-                const termInput = document.getElementById('new-term');
-                const replacementInput = document.getElementById('new-replacement');
-                
-                const term = termInput.value.trim();
-                if (!term) {
-                    showError('Please enter a term to redact');
-                    return;
-                }
-                
-                const replacement = replacementInput.value.trim() || '[REDACTED]';
-                
-                try {
-                    const response = await fetch('/api/redaction/rules', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json'
-                        },
-                        body: JSON.stringify({
-                            sensitive_term: term,
-                            replacement: replacement
-                        })
-                    });
-                    
-                    const result = await response.json();
-                    if (result.success) {
-                        termInput.value = '';
-                        replacementInput.value = '';
-                        loadRedactionRules();
-                        showStatus('Redaction rule added successfully', 'success');
-                    } else {
-                        showError(result.error || 'Failed to add redaction rule');
-                    }
-                } catch (error) {
-                    showError('Error adding redaction rule: ' + error.message);
-                }
-            }
-            
-            async function removeRedactionRule(term) {
-                if (!confirm(`Remove redaction rule for "${term}"?`)) {
-                    return;
-                }
-                
-                try {
-                    const response = await fetch(`/api/redaction/rules/${encodeURIComponent(term)}`, {
-                        method: 'DELETE'
-                    });
-                    
-                    const result = await response.json();
-                    if (result.success) {
-                        loadRedactionRules();
-                        showStatus('Redaction rule removed successfully', 'success');
-                    } else {
-                        showError(result.error || 'Failed to remove redaction rule');
-                    }
-                } catch (error) {
-                    showError('Error removing redaction rule: ' + error.message);
-                }
-            }
-        </script>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
+    if etag_matches(request, _INDEX_ETAG):
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+    
+    accepted = accepted_encodings(request)
+    if _INDEX_BROTLI is not None and "br" in accepted:
+        return HTMLResponse(content=_INDEX_BROTLI, headers={**_INDEX_HEADERS, "Content-Encoding": "br"})
+    if "gzip" in accepted:
+        return HTMLResponse(content=_INDEX_GZIP, headers={**_INDEX_HEADERS, "Content-Encoding": "gzip"})
+    # Marked identity so GZipMiddleware, which only looks for "gzip" in the header, leaves it alone
+    return HTMLResponse(content=_INDEX_HTML, headers={**_INDEX_HEADERS, "Content-Encoding": "identity"})
 
 @app.get("/api/quarantine")
-async def get_quarantine_entries() -> List[Dict[str, Any]]:
+async def get_quarantine_entries(manager: GitHubQuarantineManager = Depends(get_manager)) -> Response:
     """Get all concepts currently in quarantine."""
     try:
-        entries = manager.publishing_review_quarantine()
-        logger.info(f"Retrieved {len(entries)} quarantine entries")
-        return entries
+        count, body = await get_cached_quarantine(manager)
+        logger.info(f"Retrieved {count} quarantine entries")
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to get quarantine entries: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/quarantine/stream")
+async def stream_quarantine_events() -> EventSourceResponse:
+    """Server-Sent Events stream that fires whenever a write changes the quarantine list."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    quarantine_subscribers.add(queue)
+    
+    # sse-starlette ends the stream on client disconnect and on server shutdown, so open
+    # dashboards don't hold up a graceful exit or a --reload restart
+    async def events():
+        try:
+            while True:
+                event = await queue.get()
+                yield {"event": event, "data": "changed"}
+        finally:
+            quarantine_subscribers.discard(queue)
+    
+    return EventSourceResponse(
+        events(),
+        ping=SSE_KEEPALIVE_SECONDS,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @app.get("/api/concept/{concept_name}/content")
-async def get_concept_content(concept_name: str) -> Dict[str, Any]:
-    """Get the markdown content of a concept from GitHub repo."""
+async def get_concept_content(concept_name: str, request: Request, manager: GitHubQuarantineManager = Depends(get_manager)) -> Any:
+    """Get the markdown content of a concept from GitHub repo, with its rendered HTML."""
     try:
-        result = manager.get_concept_content(concept_name)
+        result = await get_cached_concept_content(manager, concept_name)
+        if "etag" in result and etag_matches(request, result["etag"]):
+            return Response(status_code=304, headers=_CONCEPT_CACHE_HEADERS | {"ETag": result["etag"]})
         logger.info(f"Retrieved concept content for {concept_name}")
         return result
     except Exception as e:
         logger.error(f"Failed to get concept content for {concept_name}: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback", exc_info=True)
         return {"error": str(e)}
 
-@app.post("/api/approve/{concept_name}")
-async def approve_concept(concept_name: str, request: ApprovalRequest) -> Dict[str, Any]:
-    """Approve a concept for public publishing via GitHub."""
-    try:
-        success = manager.publishing_authorize_for_publishing(concept_name, request.reviewer)
-        if success:
-            logger.info(f"Approved concept via GitHub: {concept_name} by {request.reviewer}")
-            return {"success": True, "message": f"Approved {concept_name} for publication via GitHub"}
-        else:
-            logger.error(f"Failed to approve concept via GitHub: {concept_name}")
-            return {"success": False, "error": "GitHub approval operation failed"}
-    except Exception as e:
-        logger.error(f"Error approving concept {concept_name} via GitHub: {e}")
-        logger.debug(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/api/reject/{concept_name}")
-async def reject_concept(concept_name: str, request: RejectionRequest) -> Dict[str, Any]:
-    """Reject a concept from being published via GitHub."""
-    try:
-        success = manager.publishing_reject_concept(concept_name, request.reason)
-        if success:
-            logger.info(f"Rejected concept via GitHub: {concept_name} - {request.reason}")
-            return {"success": True, "message": f"Rejected {concept_name} via GitHub"}
-        else:
-            logger.error(f"Failed to reject concept via GitHub: {concept_name}")
-            return {"success": False, "error": "GitHub rejection operation failed"}
-    except Exception as e:
-        logger.error(f"Error rejecting concept {concept_name} via GitHub: {e}")
-        logger.debug(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/api/needs_revision/{concept_name}")
-async def needs_revision_concept(concept_name: str, request: RejectionRequest) -> Dict[str, Any]:
-    """Mark a concept as needs revision via GitHub."""
-    try:
-        success = manager.publishing_needs_revision_concept(concept_name, request.reason)
-        if success:
-            logger.info(f"Marked concept as needs revision via GitHub: {concept_name} - {request.reason}")
-            return {"success": True, "message": f"Marked {concept_name} as needs revision via GitHub"}
-        else:
-            logger.error(f"Failed to mark concept as needs revision via GitHub: {concept_name}")
-            return {"success": False, "error": "GitHub needs revision operation failed"}
-    except Exception as e:
-        logger.error(f"Error marking concept {concept_name} as needs revision via GitHub: {e}")
-        logger.debug(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/api/needs_redact/{concept_name}")
-async def needs_redact_concept(concept_name: str, request: RejectionRequest) -> Dict[str, Any]:
-    """Mark a concept as needs redaction via GitHub."""
-    try:
-        success = manager.publishing_needs_redact_concept(concept_name, request.reason)
-        if success:
-            logger.info(f"Marked concept as needs redaction via GitHub: {concept_name} - {request.reason}")
-            return {"success": True, "message": f"Marked {concept_name} as needs redaction via GitHub"}
-        else:
-            logger.error(f"Failed to mark concept as needs redaction via GitHub: {concept_name}")
-            return {"success": False, "error": "GitHub needs redaction operation failed"}
-    except Exception as e:
-        logger.error(f"Error marking concept {concept_name} as needs redaction via GitHub: {e}")
-        logger.debug(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=str(e))
+@app.get("/api/concept/{concept_name}/content.md")
+async def stream_concept_content(concept_name: str, manager: GitHubQuarantineManager = Depends(get_manager)) -> StreamingResponse:
+    """Stream the raw markdown of a concept as it is read from the GitHub repo clone."""
+    chunks = await _run(manager.iter_concept_content, concept_name)
+    if chunks is None:
+        raise HTTPException(status_code=404, detail=f"Concept file not found for {concept_name}")
+    
+    # The file reads belong on the git thread too, so a queued reset or clean can't
+    # delete or rewrite the file underneath them
+    async def read_chunks():
+        try:
+            while (chunk := await _run(next, chunks, None)) is not None:
+                yield chunk
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                await _run(close)
+    
+    logger.info(f"Streaming concept content for {concept_name}")
+    return StreamingResponse(read_chunks(), media_type="text/markdown; charset=utf-8")
 
-@app.post("/api/sync")
-async def sync_authorization() -> Dict[str, Any]:
-    """Push current authorized.json back to GitHub repository."""
+@app.get("/api/concept/{concept_name}/content.html")
+async def stream_concept_html(concept_name: str, request: Request, manager: GitHubQuarantineManager = Depends(get_manager)) -> Response:
+    """Stream a concept's rendered HTML in chunks so the dashboard can show it while it downloads."""
     try:
-        success = manager.sync_authorization_file()
-        if success:
-            logger.info("GitHub push successful")
-            return {"success": True, "message": "authorized.json pushed to GitHub successfully"}
-        else:
-            logger.error("GitHub push failed")
-            return {"success": False, "error": "GitHub push operation failed"}
+        result = await get_cached_concept_content(manager, concept_name)
     except Exception as e:
-        logger.error(f"Error during GitHub push: {e}")
-        logger.debug(traceback.format_exc())
+        logger.error(f"Failed to get concept content for {concept_name}: {e}")
+        logger.debug("Traceback", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+    
+    headers = _CONCEPT_CACHE_HEADERS | {"ETag": result["etag"]}
+    if etag_matches(request, result["etag"]):
+        return Response(status_code=304, headers=headers)
+    
+    html = result["html"]
+    
+    async def chunks():
+        for start in range(0, len(html), HTML_CHUNK_SIZE):
+            yield html[start:start + HTML_CHUNK_SIZE]
+    
+    logger.info(f"Streaming rendered content for {concept_name}")
+    return StreamingResponse(chunks(), media_type="text/html; charset=utf-8", headers=headers)
+
+@app.post("/api/concepts/batch")
+async def get_concepts_content_batch(request: ConceptNamesRequest = Depends(json_body(ConceptNamesRequest)), manager: GitHubQuarantineManager = Depends(get_manager)) -> Dict[str, Dict[str, Any]]:
+    """Get the markdown content of several concepts in one request."""
+    results = {}
+    for concept_name in dict.fromkeys(request.names):
+        try:
+            results[concept_name] = await get_cached_concept_content(manager, concept_name)
+        except Exception as e:
+            logger.error(f"Failed to get concept content for {concept_name}: {e}")
+            logger.debug("Traceback", exc_info=True)
+            results[concept_name] = {"error": str(e)}
+    logger.info(f"Retrieved concept content for {len(results)} concepts in batch")
+    return results
+
+@app.post("/api/approve/{concept_name}", status_code=202)
+async def approve_concept(concept_name: str, request: ApprovalRequest = Depends(json_body(ApprovalRequest)), manager: GitHubQuarantineManager = Depends(get_manager)) -> Dict[str, Any]:
+    """Queue approval of a concept for public publishing via GitHub."""
+    return start_job(f"Approved {concept_name} for publication via GitHub", "GitHub approval operation failed", manager.publishing_authorize_for_publishing, concept_name, request.reviewer)
+
+@app.post("/api/reject/{concept_name}", status_code=202)
+async def reject_concept(concept_name: str, request: RejectionRequest = Depends(json_body(RejectionRequest)), manager: GitHubQuarantineManager = Depends(get_manager)) -> Dict[str, Any]:
+    """Queue rejection of a concept from being published via GitHub."""
+    return start_job(f"Rejected {concept_name} via GitHub", "GitHub rejection operation failed", manager.publishing_reject_concept, concept_name, request.reason)
+
+@app.post("/api/needs_revision/{concept_name}", status_code=202)
+async def needs_revision_concept(concept_name: str, request: RejectionRequest = Depends(json_body(RejectionRequest)), manager: GitHubQuarantineManager = Depends(get_manager)) -> Dict[str, Any]:
+    """Queue marking a concept as needs revision via GitHub."""
+    return start_job(f"Marked {concept_name} as needs revision via GitHub", "GitHub needs revision operation failed", manager.publishing_needs_revision_concept, concept_name, request.reason)
+
+@app.post("/api/needs_redact/{concept_name}", status_code=202)
+async def needs_redact_concept(concept_name: str, request: RejectionRequest = Depends(json_body(RejectionRequest)), manager: GitHubQuarantineManager = Depends(get_manager)) -> Dict[str, Any]:
+    """Queue marking a concept as needs redaction via GitHub."""
+    return start_job(f"Marked {concept_name} as needs redaction via GitHub", "GitHub needs redaction operation failed", manager.publishing_needs_redact_concept, concept_name, request.reason)
+
+@app.post("/api/sync", status_code=202)
+async def sync_authorization(manager: GitHubQuarantineManager = Depends(get_manager)) -> Dict[str, Any]:
+    """Queue a push of the current authorized.json back to GitHub repository."""
+    return start_job("authorized.json pushed to GitHub successfully", "GitHub push operation failed", manager.sync_authorization_file)
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str) -> Dict[str, Any]:
+    """Get the status of a queued GitHub write job."""
+    job = running_jobs.get(job_id) or jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    return job
 
 @app.get("/api/status/{concept_name}")
-async def get_concept_status(concept_name: str) -> ConceptStatusResponse:
+async def get_concept_status(concept_name: str, manager: GitHubQuarantineManager = Depends(get_manager)) -> ConceptStatusResponse:
     """Check the authorization status of a concept."""
     try:
-        status = manager.get_authorization_status(concept_name)
+        status = await _run(manager.get_authorization_status, concept_name)
         in_quarantine = status == "quarantine"
         
         return ConceptStatusResponse(
@@ -993,19 +577,38 @@ async def get_concept_status(concept_name: str) -> ConceptStatusResponse:
         )
     except Exception as e:
         logger.error(f"Error checking status for concept {concept_name}: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/status/batch")
+async def get_concept_statuses_batch(request: ConceptNamesRequest = Depends(json_body(ConceptNamesRequest)), manager: GitHubQuarantineManager = Depends(get_manager)) -> Dict[str, ConceptStatusResponse]:
+    """Check the authorization status of several concepts in one request."""
+    try:
+        statuses = await _run(manager.get_authorization_statuses, list(dict.fromkeys(request.names)))
+        logger.info(f"Retrieved status for {len(statuses)} concepts in batch")
+        return {
+            concept_name: ConceptStatusResponse(
+                concept_name=concept_name,
+                status=status,
+                in_quarantine=status == "quarantine"
+            )
+            for concept_name, status in statuses.items()
+        }
+    except Exception as e:
+        logger.error(f"Error checking status for concept batch: {e}")
+        logger.debug("Traceback", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/authorized")
-async def get_authorized_concepts() -> List[str]:
+async def get_authorized_concepts(manager: GitHubQuarantineManager = Depends(get_manager)) -> List[str]:
     """Get list of all approved concepts."""
     try:
-        approved = manager.get_approved_concepts()
+        approved = await _run(manager.get_approved_concepts)
         logger.info(f"Retrieved {len(approved)} approved concepts")
         return approved
     except Exception as e:
         logger.error(f"Failed to get approved concepts: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Redaction Management API Endpoints
@@ -1022,7 +625,7 @@ async def get_redaction_rules() -> RedactionRuleResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/redaction/rules")
-async def add_redaction_rule(request: RedactionRuleRequest) -> Dict[str, Any]:
+async def add_redaction_rule(request: RedactionRuleRequest = Depends(json_body(RedactionRuleRequest))) -> Dict[str, Any]:
     """Add a new redaction rule."""
     try:
         success = redaction_manager.add_rule(request.sensitive_term, request.replacement)
@@ -1061,7 +664,8 @@ async def preview_redactions(request: Dict[str, str]) -> Dict[str, Any]:
         if not content:
             raise HTTPException(status_code=400, detail="Content is required")
         
-        previews = redaction_manager.preview_redactions(content, int(context_chars))
+        # The scan is CPU-bound on large concepts; keep it off the event loop
+        previews = await run_in_threadpool(redaction_manager.preview_redactions, content, int(context_chars))
         logger.info(f"Generated {len(previews)} redaction previews")
         
         return {
@@ -1075,21 +679,23 @@ async def preview_redactions(request: Dict[str, str]) -> Dict[str, Any]:
 
 # Publishing workflow endpoint
 
+def get_workflow(manager: GitHubQuarantineManager = Depends(get_manager)) -> AutoRedactionWorkflow:
+    """Create the auto-redaction workflow, bound to the manager's repo clone and credentials."""
+    # Built per request, on the already-cloned repo's concepts directory: its RedactionManager
+    # reads redacted.json only when constructed, so a shared instance would keep publishing
+    # with the rules from the first run
+    return AutoRedactionWorkflow(
+        str(manager.concepts_dir),
+        github_pat=manager.github_pat,
+        carton_repo_url=manager.carton_repo_url
+    )
+
 @app.post("/api/publish_to_public")
-async def publish_to_public() -> Dict[str, Any]:
+async def publish_to_public(workflow: AutoRedactionWorkflow = Depends(get_workflow)) -> Dict[str, Any]:
     """Execute the complete auto-redaction and publishing workflow."""
     try:
         logger.info("Starting auto-redaction and publishing workflow")
         
-        # Create auto-redaction workflow instance with proper credentials
-        # Use the concepts directory from the already-cloned repo
-        repo_concepts_dir = str(manager.temp_repo_dir / "concepts")
-        workflow = AutoRedactionWorkflow(
-            repo_concepts_dir,
-            github_pat=manager.github_pat,
-            carton_repo_url=manager.carton_repo_url
-        )
-        
         # Execute the workflow
         result = await workflow.execute_auto_redaction_workflow()
         
@@ -1107,21 +713,49 @@ async def publish_to_public() -> Dict[str, Any]:
 
 # Health check endpoint
 
+# Probes hit /health constantly; the timestamp only needs one-second resolution
+_health_timestamp = (0, "")
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat(), "mode": "github"}
+    global _health_timestamp
+    now = int(time.time())
+    if now != _health_timestamp[0]:
+        _health_timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return {"status": "healthy", "timestamp": _health_timestamp[1], "mode": "github"}
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     
     # Configuration
     host = os.environ.get("WEBSERVER_HOST", "0.0.0.0")
     port = int(os.environ.get("WEBSERVER_PORT", "8081"))
+    # Jobs, caches and SSE subscribers live in-process and every worker shares one repo
+    # clone directory, so more than one worker is only safe for read-mostly deployments
+    workers = int(os.environ.get("WEBSERVER_WORKERS", "1"))
+    access_log = os.environ.get("WEBSERVER_ACCESS_LOG", "0") == "1"
     
     logger.info(f"Starting SEED GitHub Quarantine Manager webserver on {host}:{port}")
+    manager = get_manager()
     logger.info(f"GitHub repo: {manager.carton_repo_url}")
     logger.info(f"Temp repo directory: {manager.temp_repo_dir}")
     logger.info("Using single authorized.json architecture")
     
-    uvicorn.run(app, host=host, port=port)
\ No newline at end of file
+    # uvloop event loop and httptools parser when the speedups extra is installed
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(f"Event loop: {loop}, HTTP parser: {http}, workers: {workers}")
+    
+    # Multiple workers need an import string so each process can load the app itself
+    uvicorn.run(
+        f"{Path(__file__).stem}:app" if workers > 1 else app,
+        app_dir=str(Path(__file__).parent),
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        access_log=access_log
+    )
\ No newline at end of file
@@ -5,10 +5,38 @@ SEED MCP Server - Unified System Identity for Compound Intelligence
 File-based configuration system using .seed files in HEAVEN_DATA_DIR/seed/
 """
 
+import json
 import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 from fastmcp import FastMCP
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: without it tool responses are encoded by the stdlib json module
+    orjson = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # optional: only refresh_seed_membership_site needs it
+    requests = None
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as indented JSON, with non-ASCII characters \\u-escaped."""
+    if orjson is not None:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        # orjson writes non-ASCII characters raw; MCP clients have always received
+        # json.dumps' escaped form, so such payloads still go through the stdlib
+        if text.isascii():
+            return text
+    return json.dumps(obj, indent=2)
 
 # Initialize MCP
 mcp = FastMCP("SEED")
@@ -16,6 +44,14 @@ mcp = FastMCP("SEED")
 # Get HEAVEN_DATA_DIR from environment
 HEAVEN_DATA_DIR = os.environ.get("HEAVEN_DATA_DIR", "/tmp/heaven_data")
 SEED_DIR = Path(HEAVEN_DATA_DIR) / "seed"
+LLM_INTELLIGENCE_DIR = os.environ.get("LLM_INTELLIGENCE_DIR", "/tmp/llm_intelligence_responses")
+
+# Seed file locations, resolved to plain strings once so reads don't rebuild paths
+WHO_AM_I_PATH = str(SEED_DIR / "who_am_i.seed")
+HOW_DO_I_PATH = str(SEED_DIR / "how_do_i.seed")
+WHAT_DO_I_DO_PATH = str(SEED_DIR / "what_do_i_do.seed")
+MANTRA_PATH = str(SEED_DIR / "mantra.seed")
+INITIALIZED_PATH = str(SEED_DIR / ".initialized")
 
 # Default content for who_am_i.seed
 DEFAULT_WHO_AM_I = """🌱 You are the perception management AI for a unified human+AI intelligence system.
@@ -110,83 +146,143 @@ The mantra reminds us: We are not just using tools. We are becoming something un
 
 *✨ Remember: Every time you engage the compound intelligence system, you are pioneering the future of human thinking itself.*"""
 
+def _write_text(path: str, text: str):
+    """Write text to a seed file path atomically, so a crash never leaves a partial file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
 def initialize_seed_files():
     """Create SEED directory and default files if they don't exist."""
-    # Create directory if it doesn't exist
-    SEED_DIR.mkdir(parents=True, exist_ok=True)
+    # A previous run already laid down the defaults
+    if os.path.exists(INITIALIZED_PATH):
+        return
     
-    who_am_i_file = SEED_DIR / "who_am_i.seed"
-    how_do_i_file = SEED_DIR / "how_do_i.seed"
-    what_do_i_do_file = SEED_DIR / "what_do_i_do.seed"
-    mantra_file = SEED_DIR / "mantra.seed"
+    # One directory listing tells us which defaults are missing
+    try:
+        existing = set(os.listdir(SEED_DIR))
+    except FileNotFoundError:
+        SEED_DIR.mkdir(parents=True, exist_ok=True)
+        existing = set()
     
-    # Create default who_am_i.seed if missing
-    if not who_am_i_file.exists():
-        who_am_i_file.write_text(DEFAULT_WHO_AM_I)
+    for name, path, default in (
+        ("who_am_i.seed", WHO_AM_I_PATH, DEFAULT_WHO_AM_I),
+        ("how_do_i.seed", HOW_DO_I_PATH, DEFAULT_HOW_DO_I),
+        ("what_do_i_do.seed", WHAT_DO_I_DO_PATH, DEFAULT_WHAT_DO_I_DO),
+        ("mantra.seed", MANTRA_PATH, DEFAULT_MANTRA),
+    ):
+        if name not in existing:
+            _write_text(path, default)
     
-    # Create default how_do_i.seed if missing
-    if not how_do_i_file.exists():
-        how_do_i_file.write_text(DEFAULT_HOW_DO_I)
-        
-    # Create default what_do_i_do.seed if missing
-    if not what_do_i_do_file.exists():
-        what_do_i_do_file.write_text(DEFAULT_WHAT_DO_I_DO)
+    # Only mark initialized once every default is fully in place
+    _write_text(INITIALIZED_PATH, "")
+
+# Decoded seed file text keyed by path, reused until the file's (mtime_ns, size) changes;
+# the size catches same-mtime rewrites on filesystems with coarse timestamps
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+def _read_cached(path: str, default: Optional[str]) -> Optional[str]:
+    """Read a seed file, or return default if it is missing; unchanged files come from cache."""
+    # No exists() probe: a missing file surfaces as FileNotFoundError from stat or open
+    try:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _FILE_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
         
-    # Create default mantra.seed if missing
-    if not mantra_file.exists():
-        mantra_file.write_text(DEFAULT_MANTRA)
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except FileNotFoundError:
+        return default
+    
+    _FILE_CACHE[path] = (signature, text)
+    return text
 
 def read_who_am_i():
     """Read the who_am_i.seed file."""
-    who_am_i_file = SEED_DIR / "who_am_i.seed"
-    if who_am_i_file.exists():
-        return who_am_i_file.read_text()
-    return DEFAULT_WHO_AM_I
+    return _read_cached(WHO_AM_I_PATH, DEFAULT_WHO_AM_I)
 
-def read_how_do_i(component: str):
-    """Read the how_do_i.seed file and return help for component."""
-    how_do_i_file = SEED_DIR / "how_do_i.seed"
-    
-    if not how_do_i_file.exists():
-        return f"No help file found. Use seed.add_to_seed() for instructions."
+def _substitute_dirs(content: str) -> str:
+    """Fill the {HEAVEN_DATA_DIR} and {LLM_INTELLIGENCE_DIR} placeholders in how_do_i text."""
+    content = content.replace("{HEAVEN_DATA_DIR}", HEAVEN_DATA_DIR)
+    return content.replace("{LLM_INTELLIGENCE_DIR}", LLM_INTELLIGENCE_DIR)
+
+# The untouched default how_do_i.seed, already substituted
+_DEFAULT_HOW_DO_I_SUBSTITUTED = _substitute_dirs(DEFAULT_HOW_DO_I)
+
+# Parsed how_do_i help map and its component names, keyed by the file's (mtime_ns, size),
+# or by None when parsed from the default because the file is missing
+_HELP_MAP_CACHE: Optional[Tuple[Optional[Tuple[int, int]], Dict[str, str], List[str]]] = None
+
+def _load_help_map() -> Tuple[Dict[str, str], List[str]]:
+    """Parse how_do_i.seed into a component -> help map, reparsing only when the file changes."""
+    global _HELP_MAP_CACHE
     
-    content = how_do_i_file.read_text()
+    try:
+        stat = os.stat(HOW_DO_I_PATH)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if _HELP_MAP_CACHE is not None and _HELP_MAP_CACHE[0] == signature:
+            return _HELP_MAP_CACHE[1], _HELP_MAP_CACHE[2]
+        
+        with open(HOW_DO_I_PATH, encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:
+        # Deleted since initialization: fall back to the default, like the other seed files
+        signature = None
+        if _HELP_MAP_CACHE is not None and _HELP_MAP_CACHE[0] is None:
+            return _HELP_MAP_CACHE[1], _HELP_MAP_CACHE[2]
+        content = DEFAULT_HOW_DO_I
     
-    # Substitute environment variables
-    content = content.replace("{HEAVEN_DATA_DIR}", HEAVEN_DATA_DIR)
-    content = content.replace("{LLM_INTELLIGENCE_DIR}", os.environ.get("LLM_INTELLIGENCE_DIR", "/tmp/llm_intelligence_responses"))
+    # Substitute environment variables, reusing the precomputed default when unedited
+    if content == DEFAULT_HOW_DO_I:
+        content = _DEFAULT_HOW_DO_I_SUBSTITUTED
+    else:
+        content = _substitute_dirs(content)
     
     # Parse the file for component help
     help_map = {}
-    for line in content.split('\n'):
-        if '|' in line and not line.startswith('#'):
-            parts = line.split('|', 1)
-            if len(parts) == 2:
-                comp, help_text = parts
-                help_map[comp.strip().lower()] = help_text.strip()
+    for line in content.splitlines():
+        if not line or line[0] == '#':
+            continue
+        comp, sep, help_text = line.partition('|')
+        if sep:
+            help_map[comp.strip().lower()] = help_text.strip()
     
-    if component.lower() in help_map:
-        return help_map[component.lower()]
-    else:
-        available = list(help_map.keys())
-        return f"Unknown component '{component}'. Available: {available}"
+    available = list(help_map.keys())
+    _HELP_MAP_CACHE = (signature, help_map, available)
+    return help_map, available
+
+def read_how_do_i(component: str):
+    """Read the how_do_i.seed file and return help for component."""
+    help_map, available = _load_help_map()
+    help_text = help_map.get(component.lower())
+    if help_text is not None:
+        return help_text
+    return f"Unknown component '{component}'. Available: {available}"
 
 def read_what_do_i_do():
     """Read the what_do_i_do.seed file."""
-    what_do_i_do_file = SEED_DIR / "what_do_i_do.seed"
-    if what_do_i_do_file.exists():
-        return what_do_i_do_file.read_text()
-    return DEFAULT_WHAT_DO_I_DO
+    return _read_cached(WHAT_DO_I_DO_PATH, DEFAULT_WHAT_DO_I_DO)
 
 def read_mantra():
     """Read the mantra.seed file."""
-    mantra_file = SEED_DIR / "mantra.seed"
-    if mantra_file.exists():
-        return mantra_file.read_text()
-    return DEFAULT_MANTRA
-
-# Initialize files on module load
-initialize_seed_files()
+    return _read_cached(MANTRA_PATH, DEFAULT_MANTRA)
+
+# Seed files are laid down on the first tool call, not at import
+_INITIALIZED = False
+_INIT_LOCK = threading.Lock()
+
+def _ensure_init():
+    """Run initialize_seed_files once per process, even under concurrent tool calls."""
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    with _INIT_LOCK:
+        if not _INITIALIZED:
+            initialize_seed_files()
+            _INITIALIZED = True
 
 @mcp.tool()
 def who_am_i() -> str:
@@ -196,6 +292,7 @@ def who_am_i() -> str:
     Returns:
         Unified system identity string from who_am_i.seed
     """
+    _ensure_init()
     return read_who_am_i()
 
 @mcp.tool()
@@ -209,6 +306,7 @@ def how_do_i(component: str) -> str:
     Returns:
         Help text for the component from how_do_i.seed
     """
+    _ensure_init()
     return read_how_do_i(component)
 
 @mcp.tool()
@@ -219,17 +317,11 @@ def what_do_i_do() -> str:
     Returns:
         Master workflow instructions from what_do_i_do.seed
     """
+    _ensure_init()
     return read_what_do_i_do()
 
-@mcp.tool()
-def add_to_seed() -> str:
-    """
-    Instructions for extending SEED's knowledge.
-    
-    Returns:
-        Instructions on how to add to SEED files
-    """
-    return f"""To add to SEED:
+# add_to_seed only interpolates SEED_DIR, so the whole answer is fixed at import
+_ADD_TO_SEED_TEXT = f"""To add to SEED:
 
 1. Navigate to {SEED_DIR}
 2. Find who_am_i.seed, how_do_i.seed, what_do_i_do.seed, and mantra.seed files
@@ -246,6 +338,16 @@ mycomponent|MyComponent: Use mycomponent.tool() for amazing things...
 
 The files are created with defaults if they don't exist."""
 
+@mcp.tool()
+def add_to_seed() -> str:
+    """
+    Instructions for extending SEED's knowledge.
+    
+    Returns:
+        Instructions on how to add to SEED files
+    """
+    return _ADD_TO_SEED_TEXT
+
 @mcp.tool()
 def recite_mantra() -> str:
     """
@@ -254,6 +356,7 @@ def recite_mantra() -> str:
     Returns:
         The compound intelligence mantra text from mantra.seed
     """
+    _ensure_init()
     return read_mantra()
 
 # QA Ingestion Tools for SEED Publishing Pipeline
@@ -275,34 +378,36 @@ def parse_qa_json(qa_id: str) -> str:
         
         io_pairs = core_parse_qa_json(qa_id)
         
+        # Truncate long inputs/outputs for the preview, reading each field once
+        io_pairs_out = []
+        for pair in io_pairs:
+            inp = pair.input
+            out = pair.output
+            io_pairs_out.append({
+                "sequence": pair.sequence,
+                "input": inp if len(inp) <= 200 else f"{inp[:200]}...",
+                "output": out if len(out) <= 200 else f"{out[:200]}...",
+                "one_liner": pair.one_liner,
+                "key_tags": pair.key_tags,
+                "project_id": pair.project_id,
+                "timestamp": pair.timestamp
+            })
+        
         result = {
             "success": True,
             "qa_id": qa_id,
             "io_pairs_count": len(io_pairs),
-            "io_pairs": [
-                {
-                    "sequence": pair.sequence,
-                    "input": pair.input[:200] + "..." if len(pair.input) > 200 else pair.input,
-                    "output": pair.output[:200] + "..." if len(pair.output) > 200 else pair.output,
-                    "one_liner": pair.one_liner,
-                    "key_tags": pair.key_tags,
-                    "project_id": pair.project_id,
-                    "timestamp": pair.timestamp
-                }
-                for pair in io_pairs
-            ]
+            "io_pairs": io_pairs_out
         }
         
-        import json
-        return json.dumps(result, indent=2)
+        return _dumps(result)
         
     except Exception as e:
-        import json
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": str(e),
             "qa_id": qa_id
-        }, indent=2)
+        })
 
 @mcp.tool()
 def ingest_qa_to_carton(qa_id: str) -> str:
@@ -327,16 +432,14 @@ def ingest_qa_to_carton(qa_id: str) -> str:
             "message": f"Successfully ingested QA {qa_id} to Carton" if success else f"Failed to ingest QA {qa_id}"
         }
         
-        import json
-        return json.dumps(result, indent=2)
+        return _dumps(result)
         
     except Exception as e:
-        import json
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": str(e),
             "qa_id": qa_id
-        }, indent=2)
+        })
 
 @mcp.tool()
 def list_available_qa_files() -> str:
@@ -347,34 +450,32 @@ def list_available_qa_files() -> str:
         JSON string with list of available QA IDs
     """
     try:
-        import os
-        import json
-        
-        llm_intelligence_dir = os.environ.get('LLM_INTELLIGENCE_DIR', '/tmp/llm_intelligence_responses')
-        qa_sets_dir = os.path.join(llm_intelligence_dir, 'qa_sets')
+        qa_sets_dir = os.path.join(LLM_INTELLIGENCE_DIR, 'qa_sets')
         
         qa_files = []
-        if os.path.exists(qa_sets_dir):
-            for item in os.listdir(qa_sets_dir):
-                qa_json_path = os.path.join(qa_sets_dir, item, 'qa.json')
-                if os.path.exists(qa_json_path):
-                    qa_files.append(item)
+        try:
+            with os.scandir(qa_sets_dir) as it:
+                for entry in it:
+                    # is_dir() is answered from the directory read for plain entries
+                    if entry.is_dir() and os.path.exists(f"{entry.path}/qa.json"):
+                        qa_files.append(entry.name)
+        except FileNotFoundError:
+            pass
         
         result = {
             "success": True,
             "qa_files": qa_files,
             "count": len(qa_files),
-            "llm_intelligence_dir": llm_intelligence_dir
+            "llm_intelligence_dir": LLM_INTELLIGENCE_DIR
         }
         
-        return json.dumps(result, indent=2)
+        return _dumps(result)
         
     except Exception as e:
-        import json
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": str(e)
-        }, indent=2)
+        })
 
 # MCP-UI Integration for SEED Publishing Interface
 
@@ -389,6 +490,10 @@ def create_ui_resource(uri: str, iframe_url: str) -> dict:
         }
     }
 
+# show_seed_publishing_interface's serialized response per (host, port), built from
+# create_ui_resource on first use so the two cannot drift apart
+_UI_RESPONSES: Dict[Tuple[str, str], str] = {}
+
 @mcp.tool()
 def show_seed_publishing_interface() -> str:
     """
@@ -401,27 +506,65 @@ def show_seed_publishing_interface() -> str:
     Returns:
         UI resource for the SEED publishing dashboard
     """
-    import os
-    import json
-    
     # Get webserver configuration
     host = os.environ.get("WEBSERVER_HOST", "localhost")  
     port = os.environ.get("WEBSERVER_PORT", "8081")
     
-    # Create the dashboard URL
-    dashboard_url = f"http://{host}:{port}"
-    
-    # Create MCP-UI resource pointing to the webserver
-    ui_resource = create_ui_resource(
-        uri=f"ui://seed-publishing-dashboard/{host}-{port}",
-        iframe_url=dashboard_url
-    )
-    
-    import json
-    return json.dumps({
-        "content": [ui_resource],
-        "is_error": False
-    }, indent=2)
+    response = _UI_RESPONSES.get((host, port))
+    if response is None:
+        # Create the dashboard URL
+        dashboard_url = f"http://{host}:{port}"
+        
+        # Create MCP-UI resource pointing to the webserver
+        ui_resource = create_ui_resource(
+            uri=f"ui://seed-publishing-dashboard/{host}-{port}",
+            iframe_url=dashboard_url
+        )
+        response = _dumps({
+            "content": [ui_resource],
+            "is_error": False
+        })
+        _UI_RESPONSES[(host, port)] = response
+    return response
+
+# Keep-alive session for the membership site, created on first refresh
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session():
+    """Return the shared membership-site session, creating it once even under concurrent tool calls."""
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({'Content-Type': 'application/json'})
+            _SESSION = session
+    return _SESSION
+
+# Fixed refresh_seed_membership_site failures, serialized once
+_SITE_URL_MISSING_RESPONSE = _dumps({
+    "success": False,
+    "error": "SEED_MEMBERSHIP_SITE_URL not configured",
+    "message": "Set SEED_MEMBERSHIP_SITE_URL environment variable to the Replit site URL"
+})
+_API_KEY_MISSING_RESPONSE = _dumps({
+    "success": False,
+    "error": "SEED_MEMBERSHIP_SITE_API_KEY not configured",
+    "message": "Set SEED_MEMBERSHIP_SITE_API_KEY environment variable for authentication"
+})
+_REQUESTS_MISSING_RESPONSE = _dumps({
+    "success": False,
+    "error": "Refresh request failed: the requests package is not installed"
+})
+_REFRESH_TIMEOUT_RESPONSE = _dumps({
+    "success": False,
+    "error": "Refresh request timed out after 30 seconds"
+})
 
 @mcp.tool()
 def refresh_seed_membership_site() -> str:
@@ -434,70 +577,54 @@ def refresh_seed_membership_site() -> str:
     Returns:
         JSON string with refresh result status
     """
+    if requests is None:
+        return _REQUESTS_MISSING_RESPONSE
+
     try:
-        import os
-        import json
-        import requests
-        
         # Get site URL and API key from environment
         site_url = os.environ.get('SEED_MEMBERSHIP_SITE_URL', '')
         api_key = os.environ.get('SEED_MEMBERSHIP_SITE_API_KEY', '')
         
         if not site_url:
-            return json.dumps({
-                "success": False,
-                "error": "SEED_MEMBERSHIP_SITE_URL not configured",
-                "message": "Set SEED_MEMBERSHIP_SITE_URL environment variable to the Replit site URL"
-            }, indent=2)
+            return _SITE_URL_MISSING_RESPONSE
             
         if not api_key:
-            return json.dumps({
-                "success": False,
-                "error": "SEED_MEMBERSHIP_SITE_API_KEY not configured", 
-                "message": "Set SEED_MEMBERSHIP_SITE_API_KEY environment variable for authentication"
-            }, indent=2)
+            return _API_KEY_MISSING_RESPONSE
         
         # Ensure URL doesn't end with slash
         site_url = site_url.rstrip('/')
         refresh_url = f"{site_url}/api/refresh"
         
-        # Prepare headers with API key authentication
-        headers = {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        # Make the refresh request with authentication
-        response = requests.post(refresh_url, headers=headers, timeout=30)
+        # Make the refresh request with authentication, reusing the pooled connection
+        response = _get_session().post(
+            refresh_url,
+            headers={'Authorization': f'Bearer {api_key}'},
+            timeout=30
+        )
         
         if response.status_code == 200:
-            result = response.json()
-            return json.dumps({
+            result = orjson.loads(response.content) if orjson is not None else response.json()
+            return _dumps({
                 "success": True,
                 "message": result.get("message", "Refresh completed"),
                 "status_code": response.status_code,
                 "site_url": site_url
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"Refresh failed with status {response.status_code}",
                 "status_code": response.status_code,
                 "response_text": response.text
-            }, indent=2)
+            })
             
     except requests.exceptions.Timeout:
-        import json
-        return json.dumps({
-            "success": False,
-            "error": "Refresh request timed out after 30 seconds"
-        }, indent=2)
+        return _REFRESH_TIMEOUT_RESPONSE
     except Exception as e:
-        import json
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Refresh request failed: {str(e)}"
-        }, indent=2)
+        })
 
 @mcp.tool()
 def start_publishing_webserver(port: int = 8081) -> str:
@@ -514,28 +641,19 @@ def start_publishing_webserver(port: int = 8081) -> str:
     Returns:
         JSON string with webserver URL and status
     """
-    import subprocess
-    import socket
-    import json
-    import os
-    import sys
-
-    # Check if port is available
+    # Check if port is available: something accepting connections means it's taken
     def is_port_in_use(port: int) -> bool:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.bind(('localhost', port))
-                return False
-            except OSError:
-                return True
+            s.settimeout(0.05)
+            return s.connect_ex(('127.0.0.1', port)) == 0
 
     if is_port_in_use(port):
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Port {port} is already in use",
             "message": f"Try a different port or kill the process using port {port}",
             "suggestion": f"Use: lsof -ti:{port} | xargs kill -9"
-        }, indent=2)
+        })
 
     # Get the publishing module path
     seed_mcp_dir = os.path.dirname(os.path.abspath(__file__))
@@ -543,50 +661,69 @@ def start_publishing_webserver(port: int = 8081) -> str:
     webserver_path = os.path.join(publishing_dir, 'webserver_github.py')
 
     if not os.path.exists(webserver_path):
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": "Publishing webserver not found",
             "message": f"Expected at: {webserver_path}"
-        }, indent=2)
+        })
 
     # Start webserver in background
     try:
-        # Use uvicorn to run the FastAPI app
+        # Use uvicorn to run the FastAPI app. No --reload: its file watcher and extra
+        # process cost more than they give a server nobody edits while it runs, and
+        # uvicorn already picks uvloop/httptools when they are installed. Access logging
+        # stays off unless asked for, as in webserver_github's own entrypoint
         cmd = [
             sys.executable, "-m", "uvicorn",
             "seed_mcp.publishing.webserver_github:app",
             "--host", "localhost",
-            "--port", str(port),
-            "--reload"
+            "--port", str(port)
         ]
-
-        # Start process in background
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            start_new_session=True
-        )
-
-        # Give it a moment to start
-        import time
-        time.sleep(2)
+        if os.environ.get("WEBSERVER_ACCESS_LOG", "0") != "1":
+            cmd.append("--no-access-log")
+
+        # Start process in background, logging to a file: pipes nobody drains would
+        # fill up and block uvicorn once it has written enough output
+        log_path = os.path.join(tempfile.gettempdir(), f'seed_webserver_{port}.log')
+        with open(log_path, 'wb') as log_file:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+                close_fds=True
+            )
+
+        # Wait until it accepts connections or exits, bounded at 5 seconds
+        ready = False
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                break
+            if is_port_in_use(port):
+                ready = True
+                break
+            time.sleep(0.05)
 
         # Check if still running
         if process.poll() is not None:
-            stdout, stderr = process.communicate()
-            return json.dumps({
+            with open(log_path, 'rb') as log_file:
+                output = log_file.read()
+            return _dumps({
                 "success": False,
                 "error": "Webserver failed to start",
-                "stdout": stdout.decode('utf-8', errors='ignore')[:500],
-                "stderr": stderr.decode('utf-8', errors='ignore')[:500]
-            }, indent=2)
+                "output": output[-500:].decode('utf-8', errors='ignore'),
+                "log_path": log_path
+            })
 
-        return json.dumps({
+        return _dumps({
             "success": True,
             "url": f"http://localhost:{port}",
             "port": port,
             "pid": process.pid,
+            "log_path": log_path,
+            "ready": ready,
             "message": f"Publishing webserver started on http://localhost:{port}",
             "next_steps": [
                 "Open the URL in your browser",
@@ -594,13 +731,71 @@ def start_publishing_webserver(port: int = 8081) -> str:
                 "Approve/reject/redact as needed",
                 "Use refresh_seed_membership_site() to update public site"
             ]
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to start webserver: {str(e)}"
-        }, indent=2)
+        })
+
+def _scan_proc_for_webservers() -> List[Dict[str, Any]]:
+    """Find publishing webserver processes by reading /proc/<pid>/cmdline directly."""
+    webserver_processes = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                cmd = f.read()
+        except OSError:
+            # Process exited or belongs to someone we can't inspect
+            continue
+        if b'seed_mcp.publishing.webserver_github' not in cmd and b'webserver_github.py' not in cmd:
+            continue
+
+        args = cmd.rstrip(b'\x00').split(b'\x00')
+        port = None
+        if b'--port' in args:
+            port_idx = args.index(b'--port') + 1
+            if port_idx < len(args):
+                port = args[port_idx].decode(errors='ignore')
+
+        webserver_processes.append({
+            "pid": entry,
+            "port": port,
+            "command": b' '.join(args).decode(errors='ignore')[:100]
+        })
+    return webserver_processes
+
+def _scan_ps_for_webservers() -> List[Dict[str, Any]]:
+    """Find publishing webserver processes from `ps aux`, for platforms without /proc."""
+    # Check for uvicorn processes running seed publishing webserver
+    result = subprocess.run(
+        ["ps", "aux"],
+        capture_output=True,
+        text=True
+    )
+
+    webserver_processes = []
+    for line in result.stdout.split('\n'):
+        if 'seed_mcp.publishing.webserver_github' in line or 'webserver_github.py' in line:
+            # Extract PID and command
+            parts = line.split()
+            if len(parts) >= 11:
+                pid = parts[1]
+                # Try to extract port from command
+                port = None
+                if '--port' in line:
+                    port_idx = line.index('--port')
+                    port = line[port_idx:].split()[1]
+
+                webserver_processes.append({
+                    "pid": pid,
+                    "port": port,
+                    "command": " ".join(parts[10:])[:100]
+                })
+    return webserver_processes
 
 @mcp.tool()
 def get_publishing_webserver_status() -> str:
@@ -610,53 +805,29 @@ def get_publishing_webserver_status() -> str:
     Returns:
         JSON string with webserver status information
     """
-    import subprocess
-    import json
-
     try:
-        # Check for uvicorn processes running seed publishing webserver
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True
-        )
-
-        webserver_processes = []
-        for line in result.stdout.split('\n'):
-            if 'seed_mcp.publishing.webserver_github' in line or 'webserver_github.py' in line:
-                # Extract PID and command
-                parts = line.split()
-                if len(parts) >= 11:
-                    pid = parts[1]
-                    # Try to extract port from command
-                    port = None
-                    if '--port' in line:
-                        port_idx = line.index('--port')
-                        port = line[port_idx:].split()[1]
-
-                    webserver_processes.append({
-                        "pid": pid,
-                        "port": port,
-                        "command": " ".join(parts[10:])[:100]
-                    })
+        if os.path.isdir('/proc'):
+            webserver_processes = _scan_proc_for_webservers()
+        else:
+            webserver_processes = _scan_ps_for_webservers()
 
         if webserver_processes:
-            return json.dumps({
+            return _dumps({
                 "running": True,
                 "processes": webserver_processes,
                 "count": len(webserver_processes)
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return _dumps({
                 "running": False,
                 "message": "No publishing webserver processes found",
                 "suggestion": "Use start_publishing_webserver(port) to start"
-            }, indent=2)
+            })
 
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": f"Failed to check status: {str(e)}"
-        }, indent=2)
+        })
 
 def main():
     """Main entry point for SEED MCP server."""
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test RedactionManager previews against the redactions actually applied"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "seed_mcp", "publishing"))
+
+from redaction_manager import RedactionManager
+
+
+def _manager_with_rules(rules):
+    """Create a RedactionManager backed by a throwaway redacted.json"""
+    directory = tempfile.mkdtemp()
+    manager = RedactionManager(os.path.join(directory, "redacted.json"))
+    for term, replacement in rules.items():
+        manager.add_rule(term, replacement)
+    return manager
+
+
+def test_preview_matches_apply_for_overlapping_terms():
+    """Overlapping terms preview only the redactions apply_redactions makes"""
+    manager = _manager_with_rules({"abc": "[A]", "bcde": "[B]", "cd": "[C]"})
+    content = "xabcdex"
+
+    redacted, count = manager.apply_redactions(content)
+    previews = manager.preview_redactions(content)
+
+    assert (redacted, count) == ("xa[B]x", 1)
+    assert len(previews) == count
+    assert previews[0]["term"] == "bcde"
+    assert previews[0]["replacement"] == "[B]"
+    assert previews[0]["position"] == 2
+
+
+def test_preview_reports_original_positions_after_earlier_replacements():
+    """Positions refer to the original content even after longer terms were replaced"""
+    manager = _manager_with_rules({"secret-token": "[REDACTED_LONG_TOKEN]", "key": "[K]"})
+    content = "secret-token then key"
+
+    redacted, count = manager.apply_redactions(content)
+    previews = manager.preview_redactions(content)
+
+    assert count == len(previews) == 2
+    assert [preview["term"] for preview in previews] == ["secret-token", "key"]
+    assert [preview["position"] for preview in previews] == [0, content.index("key")]
+
+
+if __name__ == "__main__":
+    test_preview_matches_apply_for_overlapping_terms()
+    test_preview_reports_original_positions_after_earlier_replacements()
+    print("All redaction preview tests passed")